@@ -358,7 +358,7 @@ class ApproximationScheme(object):
                                        in system._jac_of_iter()]))
             scratch = tot_result.copy()
         else:
-            scratch = np.empty(len(system._outputs))
+            scratch = np.zeros(len(system._outputs))
 
         # Clean vector for results (copy of the outputs or resids)
         vec = system._outputs if total_or_semi else system._residuals
@@ -373,6 +373,7 @@ class ApproximationScheme(object):
 
         nruns = len(colored_approx_groups)
         tosend = None
+        prev_nzrows = None
 
         for data, jcols, vec_ind_list, nzrows, seed_vars, in colored_approx_groups:
             mult = self._get_multiplier(data)
@@ -419,8 +420,14 @@ class ApproximationScheme(object):
                 _, jcols, _, nzrows, _ = colored_approx_groups[i]
 
                 for i, col in enumerate(jcols):
-                    scratch[:] = 0.0
-                    scratch[nzrows[i]] = res[nzrows[i]]
+                    # scratch starts out all zeros, so rather than zeroing out the full
+                    # array for each column, just zero out the rows set for the previous
+                    # column.  For sparse jacobians this avoids a full array traversal
+                    # per column.
+                    if prev_nzrows is not None:
+                        scratch[prev_nzrows] = 0.0
+                    prev_nzrows = nzrows[i]
+                    scratch[prev_nzrows] = res[prev_nzrows]
                     yield col, scratch
 
     def _vec_ind_iter(self, vec_ind_list):
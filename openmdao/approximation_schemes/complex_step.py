@@ -205,9 +205,12 @@ class ComplexStep(ApproximationScheme):
         ndarray
             Copy of the outputs or residuals array after running the perturbed system.
         """
-        for vec, idxs in idx_info:
-            if vec is not None and idxs is not None:
-                vec.iadd(delta, idxs)
+        # filter out the inactive entries once so the perturb and restore loops below are
+        # tight loops over vectorized iadd/isub calls.
+        active_info = [tup for tup in idx_info if tup[0] is not None and tup[1] is not None]
+
+        for vec, idxs in active_info:
+            vec.iadd(delta, idxs)
 
         if total:
             system.run_solve_nonlinear()
@@ -216,9 +219,8 @@ class ComplexStep(ApproximationScheme):
             system.run_apply_nonlinear()
             result_array[:] = system._residuals.asarray()
 
-        for vec, idxs in idx_info:
-            if vec is not None and idxs is not None:
-                vec.isub(delta, idxs)
+        for vec, idxs in active_info:
+            vec.isub(delta, idxs)
 
         return result_array
 
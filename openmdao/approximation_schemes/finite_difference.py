@@ -318,6 +318,10 @@ class FiniteDifference(ApproximationScheme):
         deltas, coeffs, current_coeff = data
         rel_element = False
 
+        # filter out the inactive entries once per point so the perturb/restore loops in
+        # _run_sub_point are tight loops over vectorized iadd calls.
+        active_info = [tup for tup in idx_info if tup[0] is not None and tup[1] is not None]
+
         if isinstance(current_coeff, np.ndarray) and current_coeff.size > 0:
             # rel_element - each element has its own relative step.
             rel_element = True
@@ -327,12 +331,10 @@ class FiniteDifference(ApproximationScheme):
                 # copy data from outputs (if doing total derivs) or residuals (if doing partials)
                 results_array[:] = current_vec.asarray()
 
-                for vec, idxs in idx_info:
-                    if vec is not None and idxs is not None:
-
-                        results_array *= current_coeff[idxs - idx_start[0]]
-                        # We don't allow mixed fd forms, so first one is all we need.
-                        break
+                if active_info:
+                    # We don't allow mixed fd forms, so first one is all we need.
+                    _, idxs = active_info[0]
+                    results_array *= current_coeff[idxs - idx_start[0]]
 
             else:
                 results_array[:] = 0.
@@ -347,14 +349,13 @@ class FiniteDifference(ApproximationScheme):
 
         # Run the Finite Difference
         for delta, coeff in zip(deltas, coeffs):
-            results = self._run_sub_point(system, idx_info, delta, total, idx_start=idx_start,
+            results = self._run_sub_point(system, active_info, delta, total, idx_start=idx_start,
                                           rel_element=rel_element)
 
             if rel_element:
-                for vec, idxs in idx_info:
-                    if vec is not None and idxs is not None:
-                        results *= coeff[idxs - idx_start[0]]
-                        break
+                if active_info:
+                    _, idxs = active_info[0]
+                    results *= coeff[idxs - idx_start[0]]
             else:
                 results *= coeff
 
@@ -371,7 +372,8 @@ class FiniteDifference(ApproximationScheme):
         system : System
             The system having its derivs approximated.
         idx_info : tuple of (Vector, ndarray of int)
-            Tuple of wrt indices and corresponding data vector to perturb.
+            Tuple of wrt indices and corresponding data vector to perturb.  Entries with a
+            vector or indices of None have already been filtered out by _run_point.
         delta : float
             Perturbation amount.
         total : bool
@@ -387,15 +389,13 @@ class FiniteDifference(ApproximationScheme):
             Copy of the outputs or residuals array after running the perturbed system.
         """
         for vec, idxs in idx_info:
-            if vec is not None and idxs is not None:
-
-                # Support rel_element stepsizing
-                if rel_element:
-                    local_delta = delta[idxs - idx_start[0]]
-                else:
-                    local_delta = delta
+            # Support rel_element stepsizing
+            if rel_element:
+                local_delta = delta[idxs - idx_start[0]]
+            else:
+                local_delta = delta
 
-                vec.iadd(local_delta, idxs)
+            vec.iadd(local_delta, idxs)
 
         if total:
             system.run_solve_nonlinear()
@@ -407,8 +407,17 @@ class FiniteDifference(ApproximationScheme):
         system._residuals.set_val(self._starting_resids)
 
         # save results and restore starting inputs/outputs
-        system._inputs.set_val(self._starting_ins)
-        system._outputs.set_val(self._starting_outs)
+        if total:
+            system._inputs.set_val(self._starting_ins)
+            system._outputs.set_val(self._starting_outs)
+        else:
+            # inputs and outputs are read-only during apply_nonlinear, so only the
+            # vector(s) we perturbed need to be restored.
+            for vec, _ in idx_info:
+                if vec is system._inputs:
+                    vec.set_val(self._starting_ins)
+                else:
+                    vec.set_val(self._starting_outs)
 
         return self._results_tmp
 
@@ -419,8 +419,7 @@ class ExplCompTestCase(unittest.TestCase):
         prob.set_solver_print(level=0)
         prob.run_model()
 
-        inputs = prob.model.list_inputs(units=True)
-        print(inputs)
+        prob.model.list_inputs(units=True, out_stream=None)
 
         outputs = prob.model.list_outputs(implicit=False,
                                           val=True,
@@ -431,7 +430,8 @@ class ExplCompTestCase(unittest.TestCase):
                                           scaling=True,
                                           prom_name=False,
                                           hierarchical=False,
-                                          print_arrays=False)
+                                          print_arrays=False,
+                                          out_stream=None)
 
         self.assertEqual(sorted(outputs), [
             ('comp.z', {'val': [24.], 'resids': [0.], 'units': 'inch', 'shape': (1,),
@@ -451,7 +451,8 @@ class ExplCompTestCase(unittest.TestCase):
                                           scaling=True,
                                           prom_name=False,
                                           hierarchical=True,
-                                          print_arrays=False)
+                                          print_arrays=False,
+                                          out_stream=None)
 
     def test_hierarchy_list_vars_options(self):
 
@@ -11,7 +11,7 @@ except ImportError:
     from openmdao.utils.assert_utils import SkipParameterized as parameterized
 
 import numpy as np
-from scipy.sparse import coo_matrix
+from scipy.sparse import coo_matrix, csr_matrix
 
 try:
     import jax
@@ -57,61 +57,107 @@ def setup_vars(comp, ofs, wrts, sparse_partials=False, bad_sparsity=False):
     isplit = comp.isplit
     osplit = comp.osplit
 
-    slices = {}
     isizes, _ = evenly_distrib_idxs(isplit, matrix.shape[1])
-    start = end = 0
     for i, sz in enumerate(isizes):
-        end += sz
-        wrt = f"x{i}"
-        comp.add_input(wrt, np.zeros(sz))
-        slices[wrt] = slice(start, end)
-        start = end
+        comp.add_input(f"x{i}", np.zeros(sz))
 
     osizes, _ = evenly_distrib_idxs(osplit, matrix.shape[0])
-    start = end = 0
     for i, sz in enumerate(osizes):
-        end += sz
-        of = f"y{i}"
-        comp.add_output(of, np.zeros(sz))
-        slices[of] = slice(start, end)
-        start = end
+        comp.add_output(f"y{i}", np.zeros(sz))
 
     if sparse_partials:
+        # scan the full sparsity once and bucketize its nonzeros into (of, wrt) blocks
+        # rather than re-slicing and re-scanning the matrix for every pair.
+        oends = np.cumsum(osizes)
+        iends = np.cumsum(isizes)
+        ostarts = oends - osizes
+        istarts = iends - isizes
+        rows, cols = np.nonzero(matrix)
+        blkids = np.searchsorted(oends, rows, side='right') * len(isizes) + \
+            np.searchsorted(iends, cols, side='right')
+        order = np.argsort(blkids, kind='stable')  # keeps row-major order within each block
+        rows = rows[order]
+        cols = cols[order]
+        blkids = blkids[order]
+
         nbad = 0
         for i in range(len(osizes)):
             of = f"y{i}"
             for j in range(len(isizes)):
                 wrt = f"x{j}"
-                subjac = comp.sparsity[slices[of], slices[wrt]]
-                if np.any(subjac):
-                    rows, cols = np.nonzero(subjac)
-                    if bad_sparsity and rows.size > 1 and nbad < 5:
-                        rows[rows.size // 2] = -1  # remove one row/col pair
-                        mask = rows != -1
-                        rows = rows[mask]
-                        cols = cols[mask]
+                blk = i * len(isizes) + j
+                bstart, bend = np.searchsorted(blkids, [blk, blk + 1])
+                if bstart < bend:
+                    brows = rows[bstart:bend] - ostarts[i]
+                    bcols = cols[bstart:bend] - istarts[j]
+                    if bad_sparsity and brows.size > 1 and nbad < 5:
+                        # drop one row/col pair to make the declared sparsity wrong
+                        mid = brows.size // 2
+                        brows = np.delete(brows, mid)
+                        bcols = np.delete(bcols, mid)
                         nbad += 1
-                    comp.declare_partials(of=of, wrt=wrt, rows=rows, cols=cols, method=comp.method)
+                    comp.declare_partials(of=of, wrt=wrt, rows=brows, cols=bcols,
+                                          method=comp.method)
                 else:
                     comp.declare_partials(of=of, wrt=wrt, method=comp.method, dependent=False)
     else:
         comp.declare_partials(of=ofs, wrt=wrts, method=comp.method)
 
 
+# cache the random sparsity matrices, which are identical across test cases because each
+# test seeds the RNG in setUp before its first draw.  This avoids regenerating the same
+# matrix for every entry in the parameterized sweeps.
+_sparsity_cache = {}
+
+
 def setup_sparsity(mask):
-    return np.random.random(mask.shape) * mask
+    key = (mask.tobytes(), mask.shape)
+    if key not in _sparsity_cache:
+        sparsity = np.random.random(mask.shape) * mask
+        # the array is shared across tests, so freeze it to catch accidental writes
+        sparsity.setflags(write=False)
+        _sparsity_cache[key] = sparsity
+    return _sparsity_cache[key]
+
+
+def _out_names_and_slices(osplit, nrows):
+    # pre-build the output names and the slices of the stacked output/residual array they
+    # map to, so the compute/apply/solve hot loops don't redo the bookkeeping per call.
+    osizes, _ = evenly_distrib_idxs(osplit, nrows)
+    slices = []
+    start = end = 0
+    for sz in osizes:
+        end += sz
+        slices.append(slice(start, end))
+        start = end
+    return [f'y{i}' for i in range(osplit)], slices
+
+
+# cache the random indep values per split signature.  Like the sparsity cache above, the
+# first draw for a given signature happens under the RNG seeded in setUp, and tests only
+# ever read the values, so regenerating them per case buys nothing.
+_indep_vals_cache = {}
+
+
+_conns_cache = {}
 
 
 def setup_indeps(isplit, ninputs, indeps_name, comp_name):
     isizes, _ = evenly_distrib_idxs(isplit, ninputs)
+    key = (isplit, ninputs)
+    if key not in _indep_vals_cache:
+        _indep_vals_cache[key] = [np.random.random(sz) for sz in isizes]
     indeps = IndepVarComp()
-    conns = []
-    for i, sz in enumerate(isizes):
-        indep_var = 'x%d' % i
-        indeps.add_output(indep_var, np.random.random(sz))
-        conns.append((indeps_name + '.' + indep_var, comp_name + '.' + indep_var))
+    for i, (sz, val) in enumerate(zip(isizes, _indep_vals_cache[key])):
+        indeps.add_output('x%d' % i, val)
+
+    # the connection tuples are pure strings, so they can be shared across calls
+    conns_key = (isplit, indeps_name, comp_name)
+    if conns_key not in _conns_cache:
+        _conns_cache[conns_key] = [(f'{indeps_name}.x{i}', f'{comp_name}.x{i}')
+                                   for i in range(isplit)]
 
-    return indeps, conns
+    return indeps, _conns_cache[conns_key]
 
 
 class CounterGroup(Group):
@@ -133,30 +179,25 @@ class SparseCompImplicit(ImplicitComponent):
         self.osplit = osplit
         self.method = method
         self._nruns = 0
+        self._out_names, self._out_slices = _out_names_and_slices(osplit, sparsity.shape[0])
+        # keep the dense sparsity for slicing/checks but do the matvecs with a CSR operator
+        self._sp_csr = csr_matrix(sparsity)
 
     def setup(self):
         setup_vars(self, ofs='*', wrts='*')
 
     # this is defined for easier testing of coloring of approx partials
     def apply_nonlinear(self, inputs, outputs, residuals):
-        prod = self.sparsity.dot(inputs.asarray()) - outputs.asarray()
-        start = end = 0
-        for i in range(self.osplit):
-            outname = 'y%d' % i
-            end += outputs[outname].size
-            residuals[outname] = prod[start:end]
-            start = end
+        # the residual vector is stored contiguously in the same y0..yN order as prod, so
+        # write the whole array at once rather than slicing it out per output.
+        residuals.set_val(self._sp_csr.dot(inputs.asarray()) - outputs.asarray())
         self._nruns += 1
 
     # this is defined so we can more easily test coloring of approx totals in a Group above this comp
     def solve_nonlinear(self, inputs, outputs):
-        prod = self.sparsity.dot(inputs.asarray())
-        start = end = 0
-        for i in range(self.osplit):
-            outname = 'y%d' % i
-            end += outputs[outname].size
-            outputs[outname] = prod[start:end]
-            start = end
+        prod = self._sp_csr.dot(inputs.asarray())
+        for name, slc in zip(self._out_names, self._out_slices):
+            outputs[name] = prod[slc]
         self._nruns += 1
 
 
@@ -167,6 +208,12 @@ class SpObj(object):
         self._nruns = 0
 
 
+# cache the synthesized apply_nonlinear functions keyed on their input/output signature so
+# that instances sharing a signature don't each pay to parse/compile the same source (and
+# jax can reuse traces of the shared code object).
+_sparse_func_cache = {}
+
+
 class SparseFuncCompImplicit(ImplicitFuncComp):
 
     def __init__(self, sparsity, method='cs', isplit=1, osplit=1, **kwargs):
@@ -175,6 +222,10 @@ class SparseFuncCompImplicit(ImplicitFuncComp):
         self.osplit = osplit
         self.method = method
         self._nruns = 0
+        self._out_names, self._out_slices = _out_names_and_slices(osplit, sparsity.shape[0])
+        # jax arrays stay dense so the traced func can consume them; plain ndarrays get a
+        # CSR operator for the solve_nonlinear matvec.
+        self._sp_csr = csr_matrix(sparsity) if isinstance(sparsity, np.ndarray) else sparsity
 
         isizes, _ = evenly_distrib_idxs(self.isplit, self.sparsity.shape[1])
         wrts = [(f"x{i}", sz) for i, sz in enumerate(isizes)]
@@ -183,29 +234,36 @@ class SparseFuncCompImplicit(ImplicitFuncComp):
         ofs = [(f"y{i}", sz) for i, sz in enumerate(osizes)]
 
         # define apply_nonlinear function
-        iparams = ','.join([n for n,_ in wrts])
-        oparams = ','.join([n for n,_ in ofs])
-        params = ','.join((iparams, oparams))
-        flines = ['def func(' + params + ',sparsity):']
-        if len(wrts) > 1:
-            flines.append(f'    iarr = np.concatenate(({iparams}))')
+        func_key = (tuple(wrts), tuple(ofs))
+        if func_key in _sparse_func_cache:
+            func = _sparse_func_cache[func_key]
         else:
-            flines.append(f'    iarr = {iparams[0]}0')
-        if len(ofs) > 1:
-            flines.append(f'    oarr = np.concatenate(({oparams}))')
-        else:
-            flines.append(f'    oarr = {oparams[0]}0')
-        flines.append('    prod = sparsity.mat.dot(iarr) - oarr')
-        flines.append('    sparsity._nruns += 1')
-        start = end = 0
-        for name, sz in ofs:
-            end += sz
-            flines.append(f"    r{name} = prod[{start}:{end}]")
-            start = end
-        flines.append('    return ' + ','.join([f"r{n}" for n,_ in ofs]))
-        fbody = '\n'.join(flines)
-        exec(fbody)  # nosec trusted input
-        f = omf.wrap(locals()['func'])
+            iparams = ','.join([n for n,_ in wrts])
+            oparams = ','.join([n for n,_ in ofs])
+            params = ','.join((iparams, oparams))
+            flines = ['def func(' + params + ',sparsity):']
+            if len(wrts) > 1:
+                flines.append(f'    iarr = np.concatenate(({iparams}))')
+            else:
+                flines.append(f'    iarr = {iparams[0]}0')
+            if len(ofs) > 1:
+                flines.append(f'    oarr = np.concatenate(({oparams}))')
+            else:
+                flines.append(f'    oarr = {oparams[0]}0')
+            flines.append('    prod = sparsity.mat.dot(iarr) - oarr')
+            flines.append('    sparsity._nruns += 1')
+            start = end = 0
+            for name, sz in ofs:
+                end += sz
+                flines.append(f"    r{name} = prod[{start}:{end}]")
+                start = end
+            flines.append('    return ' + ','.join([f"r{n}" for n,_ in ofs]))
+            fbody = '\n'.join(flines)
+            namespace = {}
+            exec(fbody, globals(), namespace)  # nosec trusted input
+            func = _sparse_func_cache[func_key] = namespace['func']
+
+        f = omf.wrap(func)
 
         for name, sz in wrts:
             f.add_input(name, shape=sz)
@@ -224,12 +282,8 @@ class SparseFuncCompImplicit(ImplicitFuncComp):
     # this is defined so we can more easily test coloring of approx totals in a Group above this comp
     def solve_nonlinear(self, inputs, outputs):
         prod = self.sparsity.dot(inputs.asarray())
-        start = end = 0
-        for i in range(self.osplit):
-            outname = 'y%d' % i
-            end += outputs[outname].size
-            outputs[outname] = prod[start:end]
-            start = end
+        for name, slc in zip(self._out_names, self._out_slices):
+            outputs[name] = prod[slc]
         self._nruns += 1
 
 
@@ -244,18 +298,16 @@ class SparseCompExplicit(ExplicitComponent):
         self.sparse_partials = sparse_partials
         self.bad_sparsity = bad_sparsity
         self._nruns = 0
+        self._out_names, self._out_slices = _out_names_and_slices(osplit, sparsity.shape[0])
+        self._sp_csr = csr_matrix(sparsity)
 
     def setup(self):
         setup_vars(self, ofs='*', wrts='*', sparse_partials=self.sparse_partials, bad_sparsity=self.bad_sparsity)
 
     def compute(self, inputs, outputs):
-        prod = self.sparsity.dot(inputs.asarray())
-        start = end = 0
-        for i in range(self.osplit):
-            outname = 'y%d' % i
-            end += outputs[outname].size
-            outputs[outname] = prod[start:end]
-            start = end
+        prod = self._sp_csr.dot(inputs.asarray())
+        for name, slc in zip(self._out_names, self._out_slices):
+            outputs[name] = prod[slc]
         self._nruns += 1
 
 
@@ -267,40 +319,64 @@ _TOLS = {
 }
 
 def _check_partial_matrix(system, jac, expected, method):
-    blocks = []
+    # assemble the subjacs directly into a preallocated full jacobian instead of
+    # hstack/vstack-ing per-block copies.
+    row_slices = {}
+    start = end = 0
     for abs_of, ofmeta in system._var_allprocs_abs2meta['output'].items():
-        cblocks = []
-        for abs_wrt, wrtmeta in system._var_allprocs_abs2meta['input'].items():
+        end += ofmeta['size']
+        row_slices[abs_of] = slice(start, end)
+        start = end
+    nrows = end
+
+    col_slices = {}
+    start = end = 0
+    for abs_wrt, wrtmeta in system._var_allprocs_abs2meta['input'].items():
+        end += wrtmeta['size']
+        col_slices[abs_wrt] = slice(start, end)
+        start = end
+    ncols = end
+
+    fullJ = np.zeros((nrows, ncols))
+
+    for abs_of in row_slices:
+        for abs_wrt in col_slices:
             key = (abs_of, abs_wrt)
             if key in jac:
                 meta = jac[key]
                 if meta['rows'] is not None:
-                    cblocks.append(coo_matrix((meta['val'], (meta['rows'], meta['cols'])), shape=meta['shape']).toarray())
+                    # scatter the COO values straight into the block view; rows/cols come
+                    # from declare_partials so they contain no duplicates.
+                    block = fullJ[row_slices[abs_of], col_slices[abs_wrt]]
+                    block[meta['rows'], meta['cols']] = meta['val']
                 elif meta['dependent']:
-                    cblocks.append(meta['val'])
-                else:
-                    cblocks.append(np.zeros(meta['shape']))
+                    fullJ[row_slices[abs_of], col_slices[abs_wrt]] = meta['val']
+                # else: non-dependent subjac, leave the preallocated zeros in place
             else: # sparsity was all zeros so we declared this subjac as not dependent
                 relof = abs_of.rsplit('.', 1)[-1]
                 relwrt = abs_wrt.rsplit('.', 1)[-1]
+                found = False
                 for decl_key, meta in system._declared_partials_patterns.items():
                     if not meta['dependent']:
                         ofpats, wrtpats = decl_key
-                        done = False
+                        if isinstance(ofpats, str):
+                            ofpats = (ofpats,)
+                        if isinstance(wrtpats, str):
+                            wrtpats = (wrtpats,)
                         for p in ofpats:
                             if fnmatchcase(relof, p):
                                 for wp in wrtpats:
                                     if fnmatchcase(relwrt, wp):
-                                        cblocks.append(np.zeros((ofmeta['size'], wrtmeta['size'])))
-                                        done = True
+                                        found = True
                                         break
-                                if done:
+                                if found:
                                     break
-                if (relof, relwrt) in system._declared_partials_patterns and not system._declared_partials_patterns[(relof, relwrt)].get('dependent'):
-                    cblocks.append(np.zeros((ofmeta['size'], wrtmeta['size'])))
-        if cblocks:
-            blocks.append(np.hstack(cblocks))
-    fullJ = np.vstack(blocks)
+                    if found:
+                        break
+                if not found:
+                    raise AssertionError(f"subjac {key} is missing from the jacobian but was "
+                                         "never declared as non-dependent")
+
     np.testing.assert_allclose(fullJ, expected, rtol=_TOLS[method])
 
 
@@ -355,6 +431,53 @@ _BIGMASK = np.array(
 )
 
 
+# small masks shared by multiple tests below, hoisted so each parameterized case
+# references the same array (and hits the same setup_sparsity cache entry).
+_SMALLMASK = np.array(
+    [[1, 0, 0, 1, 1],
+     [0, 1, 0, 1, 1],
+     [0, 1, 0, 1, 1],
+     [1, 0, 0, 0, 0],
+     [0, 1, 1, 0, 0]]
+)
+
+# sparsity with last row and col all zeros.  a bug caused an exception when we
+# created a COO matrix from this without supplying the shape.
+_ZERO_ROWCOL_MASK = np.array(
+    [[1, 0, 0, 1, 1, 1, 0],
+     [0, 1, 0, 1, 0, 1, 0],
+     [0, 1, 0, 1, 1, 1, 0],
+     [1, 0, 0, 0, 0, 1, 0],
+     [0, 0, 0, 0, 0, 0, 0]]
+)
+
+# coloring of this mask improves on the uncolored solve by less than 20%
+_MIN_IMPROVE_MASK = np.array(
+    [[1, 0, 1, 0, 1, 1],
+     [1, 1, 1, 0, 0, 1],
+     [0, 1, 0, 1, 1, 0],
+     [1, 0, 1, 0, 0, 1]]
+)
+
+
+# design var bounds reused by the totals tests below
+_LOWER2 = np.ones(2)
+_UPPER2 = _LOWER2 + .1
+_LOWER3 = np.ones(3)
+_UPPER3 = _LOWER3 + .1
+for _b in (_LOWER2, _UPPER2, _LOWER3, _UPPER3):
+    _b.setflags(write=False)
+
+
+# initial indep values reused by the tests below
+_X0_3 = np.array([1.03, 1.04, 1.05])
+_X1_2 = np.array([1.06, 1.07])
+_X0_4 = np.array([1.03, 1.04, 1.05, 1.06])
+_X1_3 = np.array([1.06, 1.07, 1.08])
+for _v in (_X0_3, _X1_2, _X0_4, _X1_3):
+    _v.setflags(write=False)
+
+
 def _test_func_name(func, num, param):
     args = []
     for p in param.args:
@@ -406,8 +529,9 @@ class TestColoringExplicit(unittest.TestCase):
         prob.set_solver_print(level=0)
         prob.run_model()
 
+        # the first linearize triggers the dynamic coloring computation; it restores the
+        # model state it perturbs, so no run_model is needed before the counted linearize.
         comp.run_linearize()
-        prob.run_model()
         start_nruns = comp._nruns
         comp.run_linearize()
         self.assertEqual(comp._nruns - start_nruns, 10)
@@ -490,8 +614,9 @@ class TestColoringExplicit(unittest.TestCase):
         prob.set_solver_print(level=0)
         prob.run_model()
 
+        # the first linearize computes the shared coloring and restores model state, so the
+        # counted per-comp linearizes below don't need another run_model first.
         prob.model.run_linearize()
-        prob.run_model()
         start_nruns = [c._nruns for c in comps]
         for i, comp in enumerate(comps):
             comp.run_linearize()
@@ -544,7 +669,6 @@ class TestColoringImplicit(unittest.TestCase):
         prob.run_model()
 
         comp.run_linearize()
-        prob.run_model()
         start_nruns = comp._nruns
         comp.run_linearize()
         self.assertEqual(comp._nruns - start_nruns, 10 + sparsity.shape[0])
@@ -651,7 +775,6 @@ class TestColoringImplicitFuncComp(unittest.TestCase):
         prob.run_model()
 
         comp.run_linearize()
-        prob.run_model()
         comp.run_linearize()
         jac = comp._jacobian._subjacs_info
         _check_partial_matrix(comp, jac, sparsity, method)
@@ -828,15 +951,7 @@ class TestColoring(unittest.TestCase):
         prob = Problem(coloring_dir=self.tempdir)
         model = prob.model
 
-        # create sparsity with last row and col all zeros.
-        # bug caused an exception when we created a COO matrix without supplying shape
-        mask = np.array(
-                [[1, 0, 0, 1, 1, 1, 0],
-                 [0, 1, 0, 1, 0, 1, 0],
-                 [0, 1, 0, 1, 1, 1, 0],
-                 [1, 0, 0, 0, 0, 1, 0],
-                 [0, 0, 0, 0, 0, 0, 0]]
-            )
+        mask = _ZERO_ROWCOL_MASK
 
         isplit = 2
         sparsity = setup_sparsity(mask)
@@ -852,8 +967,8 @@ class TestColoring(unittest.TestCase):
 
         prob.setup(check=False, mode='fwd')
 
-        prob.set_val('indeps.x0', [1.03, 1.04, 1.05, 1.06])
-        prob.set_val('indeps.x1', [1.06, 1.07, 1.08])
+        prob.set_val('indeps.x0', _X0_4)
+        prob.set_val('indeps.x1', _X1_3)
 
         prob.set_solver_print(level=0)
         prob.run_model()
@@ -866,12 +981,7 @@ class TestColoring(unittest.TestCase):
         prob = Problem(coloring_dir=self.tempdir)
         model = prob.model
 
-        mask = np.array(
-                [[1, 0, 1, 0, 1, 1],
-                 [1, 1, 1, 0, 0, 1],
-                 [0, 1, 0, 1, 1, 0],
-                 [1, 0, 1, 0, 0, 1]]
-            )
+        mask = _MIN_IMPROVE_MASK
 
         isplit = 2
         sparsity = setup_sparsity(mask)
@@ -907,12 +1017,7 @@ class TestColoring(unittest.TestCase):
         prob = Problem(coloring_dir=self.tempdir)
         model = prob.model
 
-        mask = np.array(
-                [[1, 0, 1, 0, 1, 1],
-                 [1, 1, 1, 0, 0, 1],
-                 [0, 1, 0, 1, 1, 0],
-                 [1, 0, 1, 0, 0, 1]]
-            )
+        mask = _MIN_IMPROVE_MASK
 
         isplit = 2
         sparsity = setup_sparsity(mask)
@@ -961,13 +1066,7 @@ class TestColoring(unittest.TestCase):
         prob.driver = pyOptSparseDriver(optimizer='SLSQP')
         prob.driver.declare_coloring()
 
-        mask = np.array(
-            [[1, 0, 0, 1, 1],
-             [0, 1, 0, 1, 1],
-             [0, 1, 0, 1, 1],
-             [1, 0, 0, 0, 0],
-             [0, 1, 1, 0, 0]]
-        )
+        mask = _SMALLMASK
 
         isplit = 2
         sparsity = setup_sparsity(mask)
@@ -981,13 +1080,13 @@ class TestColoring(unittest.TestCase):
 
         model.comp.add_objective('y0', index=0)  # pyoptsparse SLSQP requires a scalar objective, so pick index 0
         model.comp.add_constraint('y1', lower=[1., 2.])
-        model.add_design_var('indeps.x0', lower=np.ones(3), upper=np.ones(3)+.1)
-        model.add_design_var('indeps.x1', lower=np.ones(2), upper=np.ones(2)+.1)
+        model.add_design_var('indeps.x0', lower=_LOWER3, upper=_UPPER3)
+        model.add_design_var('indeps.x1', lower=_LOWER2, upper=_UPPER2)
         model.approx_totals(method=method)
         prob.setup(check=False, mode='fwd')
 
-        prob.set_val('indeps.x0', [1.03, 1.04, 1.05])
-        prob.set_val('indeps.x1', [1.06, 1.07])
+        prob.set_val('indeps.x0', _X0_3)
+        prob.set_val('indeps.x1', _X1_2)
 
         prob.set_solver_print(level=0)
         prob.run_driver()  # need this to trigger the dynamic coloring
@@ -1032,14 +1131,14 @@ class TestColoring(unittest.TestCase):
 
         model.comp.add_objective('y0', index=0)  # pyoptsparse SLSQP requires a scalar objective, so pick index 0
         model.comp.add_constraint('y1', lower=[1., 2.])
-        model.add_design_var('indeps.x0', lower=np.ones(3), upper=np.ones(3)+.1)
-        model.add_design_var('indeps.x1', lower=np.ones(2), upper=np.ones(2)+.1)
+        model.add_design_var('indeps.x0', lower=_LOWER3, upper=_UPPER3)
+        model.add_design_var('indeps.x1', lower=_LOWER2, upper=_UPPER2)
         model.approx_totals(method='cs')
         model.declare_coloring(min_improve_pct=25., method='cs')
         prob.setup(check=False, mode='fwd')
 
-        prob.set_val('indeps.x0', [1.03, 1.04, 1.05])
-        prob.set_val('indeps.x1', [1.06, 1.07])
+        prob.set_val('indeps.x0', _X0_3)
+        prob.set_val('indeps.x1', _X1_2)
 
         prob.set_solver_print(level=0)
 
@@ -1065,13 +1164,7 @@ class TestColoring(unittest.TestCase):
         prob.driver = pyOptSparseDriver(optimizer='SLSQP')
         prob.driver.declare_coloring()
 
-        mask = np.array(
-            [[1, 0, 0, 1, 1],
-             [0, 1, 0, 1, 1],
-             [0, 1, 0, 1, 1],
-             [1, 0, 0, 0, 0],
-             [0, 1, 1, 0, 0]]
-        )
+        mask = _SMALLMASK
 
         isplit = 2
         sparsity = setup_sparsity(mask)
@@ -1085,15 +1178,15 @@ class TestColoring(unittest.TestCase):
 
         model.comp.add_objective('y0', index=1)
         model.comp.add_constraint('y1', lower=[1., 2.])
-        model.add_design_var('indeps.x0', lower=np.ones(3), upper=np.ones(3)+.1)
-        model.add_design_var('indeps.x1', lower=np.ones(2), upper=np.ones(2)+.1)
+        model.add_design_var('indeps.x0', lower=_LOWER3, upper=_UPPER3)
+        model.add_design_var('indeps.x1', lower=_LOWER2, upper=_UPPER2)
 
         model.approx_totals(method=method)
 
         prob.setup(check=False, mode='fwd')
 
-        prob.set_val('indeps.x0', [1.03, 1.04, 1.05])
-        prob.set_val('indeps.x1', [1.06, 1.07])
+        prob.set_val('indeps.x0', _X0_3)
+        prob.set_val('indeps.x1', _X1_2)
 
         prob.set_solver_print(level=0)
         prob.run_driver()  # need this to trigger the dynamic coloring
@@ -1118,13 +1211,7 @@ class TestColoring(unittest.TestCase):
         prob.driver = pyOptSparseDriver(optimizer='SLSQP')
         prob.driver.declare_coloring()
 
-        mask = np.array(
-            [[1, 0, 0, 1, 1],
-             [0, 1, 0, 1, 1],
-             [0, 1, 0, 1, 1],
-             [1, 0, 0, 0, 0],
-             [0, 1, 1, 0, 0]]
-        )
+        mask = _SMALLMASK
 
         isplit=2
         sparsity = setup_sparsity(mask)
@@ -1140,15 +1227,15 @@ class TestColoring(unittest.TestCase):
 
         model.comp.add_objective('y0', index=1)
         model.comp.add_constraint('y1', lower=[1., 2.])
-        model.add_design_var('indeps.x0',  indices=[0,2], lower=np.ones(2), upper=np.ones(2)+.1)
-        model.add_design_var('indeps.x1', lower=np.ones(2), upper=np.ones(2)+.1)
+        model.add_design_var('indeps.x0',  indices=[0,2], lower=_LOWER2, upper=_UPPER2)
+        model.add_design_var('indeps.x1', lower=_LOWER2, upper=_UPPER2)
 
         model.approx_totals(method=method)
 
         prob.setup(check=False, mode='fwd')
 
-        prob.set_val('indeps.x0', [1.03, 1.04, 1.05])
-        prob.set_val('indeps.x1', [1.06, 1.07])
+        prob.set_val('indeps.x0', _X0_3)
+        prob.set_val('indeps.x1', _X1_2)
 
         prob.set_solver_print(level=0)
         prob.run_driver()  # need this to trigger the dynamic coloring
@@ -1161,7 +1248,7 @@ class TestColoring(unittest.TestCase):
         self.assertEqual(model._nruns - start_nruns, 2)
         cols = [0,2,3,4]
         rows = [1,3,4]
-        _check_total_matrix(model, derivs, sparsity[rows, :][:, cols], method)
+        _check_total_matrix(model, derivs, sparsity[np.ix_(rows, cols)], method)
 
     def test_no_solver_linearize(self):
         # this raised a singularity error before the fix
@@ -1207,6 +1294,48 @@ class TestColoring(unittest.TestCase):
         p.setup()
         p.run_model()
 
+    @parameterized.expand(itertools.product(
+        ['fd', 'cs'],
+        ), name_func=_test_func_name
+    )
+    def test_total_coloring_with_assembled_jac(self, method):
+        # a partial-colored comp under an assembled jacobian; the randomized subjacs used
+        # for total coloring must match the type the assembled matrix classes expect
+        prob = Problem(coloring_dir=self.tempdir)
+        model = prob.model
+
+        mask = _SMALLMASK
+
+        isplit = 2
+        sparsity = setup_sparsity(mask)
+        indeps, conns = setup_indeps(isplit, mask.shape[1], 'indeps', 'comp')
+
+        model.add_subsystem('indeps', indeps)
+        comp = model.add_subsystem('comp', SparseCompExplicit(sparsity, method,
+                                                              isplit=isplit, osplit=2))
+        model.connect('indeps.x0', 'comp.x0')
+        model.connect('indeps.x1', 'comp.x1')
+        comp.declare_coloring('x*', method=method)
+
+        model.linear_solver = DirectSolver(assemble_jac=True)
+
+        model.comp.add_objective('y0', index=0)
+        model.comp.add_constraint('y1', lower=[1., 2.])
+        model.add_design_var('indeps.x0', lower=_LOWER3, upper=_UPPER3)
+        model.add_design_var('indeps.x1', lower=_LOWER2, upper=_UPPER2)
+
+        prob.setup(check=False, mode='fwd')
+
+        prob.set_val('indeps.x0', _X0_3)
+        prob.set_val('indeps.x1', _X1_2)
+
+        prob.set_solver_print(level=0)
+        prob.run_model()
+        prob.compute_totals()  # trigger the dynamic partial coloring
+
+        coloring = compute_total_coloring(prob)
+        self.assertIsNotNone(coloring)
+
 
 class TestStaticColoring(unittest.TestCase):
 
@@ -1231,15 +1360,7 @@ class TestStaticColoring(unittest.TestCase):
         prob = Problem(coloring_dir=self.tempdir)
         model = prob.model
 
-        # create sparsity with last row and col all zeros.
-        # bug happened when we created a COO matrix without supplying shape
-        mask = np.array(
-                [[1, 0, 0, 1, 1, 1, 0],
-                 [0, 1, 0, 1, 0, 1, 0],
-                 [0, 1, 0, 1, 1, 1, 0],
-                 [1, 0, 0, 0, 0, 1, 0],
-                 [0, 0, 0, 0, 0, 0, 0]]
-            )
+        mask = _ZERO_ROWCOL_MASK
 
         isplit = 2
         sparsity = setup_sparsity(mask)
@@ -1424,13 +1545,7 @@ class TestStaticColoring(unittest.TestCase):
         prob = Problem(coloring_dir=self.tempdir)
         model = prob.model
 
-        mask = np.array(
-            [[1, 0, 0, 1, 1],
-             [0, 1, 0, 1, 1],
-             [0, 1, 0, 1, 1],
-             [1, 0, 0, 0, 0],
-             [0, 1, 1, 0, 0]]
-        )
+        mask = _SMALLMASK
 
         isplit = 2
         sparsity = setup_sparsity(mask)
@@ -1492,13 +1607,7 @@ class TestStaticColoring(unittest.TestCase):
         prob = Problem(coloring_dir=self.tempdir)
         model = prob.model
 
-        mask = np.array(
-            [[1, 0, 0, 1, 1],
-             [0, 1, 0, 1, 1],
-             [0, 1, 0, 1, 1],
-             [1, 0, 0, 0, 0],
-             [0, 1, 1, 0, 0]]
-        )
+        mask = _SMALLMASK
 
         isplit = 2
         sparsity = setup_sparsity(mask)
@@ -1563,13 +1672,7 @@ class TestStaticColoring(unittest.TestCase):
         prob = Problem(coloring_dir=self.tempdir)
         model = prob.model
 
-        mask = np.array(
-            [[1, 0, 0, 1, 1],
-             [0, 1, 0, 1, 1],
-             [0, 1, 0, 1, 1],
-             [1, 0, 0, 0, 0],
-             [0, 1, 1, 0, 0]]
-        )
+        mask = _SMALLMASK
 
         isplit = 2
         sparsity = setup_sparsity(mask)
@@ -1628,7 +1731,7 @@ class TestStaticColoring(unittest.TestCase):
         nruns = comp._nruns - start_nruns
         self.assertEqual(nruns, 3)
         cols = rows = [0,2,3,4]
-        _check_total_matrix(model, derivs, sparsity[rows, :][:, cols], method)
+        _check_total_matrix(model, derivs, sparsity[np.ix_(rows, cols)], method)
 
 
 
@@ -1668,13 +1771,7 @@ class TestStaticColoringParallelCS(unittest.TestCase):
         prob = Problem(coloring_dir=self.tempdir)
         model = prob.model
 
-        mask = np.array(
-            [[1, 0, 0, 1, 1],
-                [0, 1, 0, 1, 1],
-                [0, 1, 0, 1, 1],
-                [1, 0, 0, 0, 0],
-                [0, 1, 1, 0, 0]]
-        )
+        mask = _SMALLMASK
         if MPI.COMM_WORLD.rank == 0:
             sparsity = setup_sparsity(mask)
             MPI.COMM_WORLD.bcast(sparsity, root=0)
@@ -335,10 +335,14 @@ class AssembledJacobian(Jacobian):
 
         if self._randgen:
             for key in iters:
-                int_mtx._update_submat(key, self._randomize_subjac(subjacs[key]['val'], key))
+                int_mtx._update_submat(key,
+                                       self._randomize_subjac(subjacs[key]['val'], key,
+                                                              dense=True))
 
             for key in iters_in_ext:
-                ext_mtx._update_submat(key, self._randomize_subjac(subjacs[key]['val'], key))
+                ext_mtx._update_submat(key,
+                                       self._randomize_subjac(subjacs[key]['val'], key,
+                                                              dense=True))
         else:
 
             for key in iters:
@@ -316,7 +316,7 @@ class _CheckingJacobian(DictionaryJacobian):
         if self._col_varnames is None:
             self._setup_index_maps(system)
 
-        wrt = self._col_varnames[self._col2name_ind[icol]]
+        wrt = self._col_varnames[np.searchsorted(self._col_var_ends, icol, side='right')]
         loc_idx = icol - self._col_var_offset[wrt]  # local col index into subjacs
 
         scratch = np.zeros(column.shape)
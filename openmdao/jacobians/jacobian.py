@@ -3,7 +3,7 @@ import weakref
 
 import numpy as np
 
-from scipy.sparse import issparse
+from scipy.sparse import coo_matrix, issparse
 
 from openmdao.core.constants import INT_DTYPE
 from openmdao.utils.name_maps import key2abs_key
@@ -45,8 +45,20 @@ class Jacobian(object):
         Maps column name to offset into the result array.
     _col_varnames : list
         List of column var names.
-    _col2name_ind : ndarray
-        Array that maps jac col index to index of column name.
+    _col_var_ends : ndarray
+        Array of ending jac col indices for each column var, used to map a col index to
+        the index of its column name.
+    _wrt_subjac_cache : dict
+        Maps each wrt name to a pair of lists, one of dense subjacs and one of COO subjacs
+        (with their column-sorted index arrays), covering all ofs for that wrt.  Built
+        lazily so set_col can skip the per-column subjac lookups and format branches.
+    _cs_paired_vals : dict
+        Maps subjac key to a (real val, complex val) array pair so that toggling complex
+        step mode reuses the same buffers instead of reallocating every subjac.
+    _of_iter_cache : list
+        Materialized result of system._jac_of_iter(), so repeated column sets don't rebuild it.
+    _wrt_iter_cache : list
+        Materialized result of system._jac_wrt_iter().
     """
 
     def __init__(self, system):
@@ -59,14 +71,18 @@ class Jacobian(object):
         self._abs_keys = {}
         self._col_var_offset = None
         self._col_varnames = None
-        self._col2name_ind = None
+        self._col_var_ends = None
+        self._wrt_subjac_cache = None
+        self._cs_paired_vals = {}
+        self._of_iter_cache = None
+        self._wrt_iter_cache = None
 
     def _get_abs_key(self, key):
-        if key in self._abs_keys:
-            return self._abs_keys[key]
-        abskey = key2abs_key(self._system(), key)
-        if abskey is not None:
-            self._abs_keys[key] = abskey
+        abskey = self._abs_keys.get(key)
+        if abskey is None:
+            abskey = key2abs_key(self._system(), key)
+            if abskey is not None:
+                self._abs_keys[key] = abskey
         return abskey
 
     def _abs_key2shape(self, abs_key):
@@ -123,9 +139,9 @@ class Jacobian(object):
         ndarray or spmatrix or list[3]
             sub-Jacobian as an array, sparse mtx, or AIJ/IJ list or tuple.
         """
-        abs_key = self._get_abs_key(key)
-        if abs_key in self._subjacs_info:
-            return self._subjacs_info[abs_key]['val']
+        meta = self._subjacs_info.get(self._get_abs_key(key))
+        if meta is not None:
+            return meta['val']
         else:
             msg = '{}: Variable name pair ("{}", "{}") not found.'
             raise KeyError(msg.format(self.msginfo, key[0], key[1]))
@@ -147,12 +163,11 @@ class Jacobian(object):
             raise KeyError(msg.format(self.msginfo, key[0], key[1]))
 
         # You can only set declared subjacobians.
-        if abs_key not in self._subjacs_info:
+        subjacs_info = self._subjacs_info.get(abs_key)
+        if subjacs_info is None:
             msg = '{}: Variable name pair ("{}", "{}") must first be declared.'
             raise KeyError(msg.format(self.msginfo, key[0], key[1]))
 
-        subjacs_info = self._subjacs_info[abs_key]
-
         if issparse(subjac):
             subjacs_info['val'] = subjac
         else:
@@ -160,16 +175,21 @@ class Jacobian(object):
 
             if rows is None:
                 # Dense subjac
-                subjac = np.atleast_2d(subjac)
-                if subjac.shape != (1, 1):
-                    shape = self._abs_key2shape(abs_key)
-                    subjac = subjac.reshape(shape)
-
-                subjacs_info['val'][:] = subjac
+                val = subjacs_info['val']
+                if isinstance(subjac, (int, float, complex)):
+                    # scalar broadcast, e.g. jac[key] = 0.0, needs no array wrapping
+                    val.fill(subjac)
+                else:
+                    subjac = np.asarray(subjac)
+                    if subjac.size == 1:
+                        val.fill(subjac.item())
+                    else:
+                        # reshape only creates a view here, so the data is copied in one pass
+                        np.copyto(val, subjac.reshape(val.shape))
 
             else:
                 try:
-                    subjacs_info['val'][:] = subjac
+                    np.copyto(subjacs_info['val'], subjac)
                 except ValueError:
                     subjac = np.atleast_1d(subjac)
                     msg = '{}: Sub-jacobian for key {} has the wrong shape ({}), expected ({}).'
@@ -257,7 +277,7 @@ class Jacobian(object):
         """
         pass
 
-    def _randomize_subjac(self, subjac, key):
+    def _randomize_subjac(self, subjac, key, dense=False):
         """
         Return a subjac that is the given subjac filled with random values.
 
@@ -267,16 +287,19 @@ class Jacobian(object):
             Sub-jacobian to be randomized.
         key : tuple (of, wrt)
             Key for subjac within the jacobian.
+        dense : bool
+            If True, return a dense array for a dense declared subjac even when a computed
+            sparsity pattern is known. The assembled matrix classes require the randomized
+            value to have the same type as the declared value.
 
         Returns
         -------
-        ndarray or csc_matrix
+        ndarray or sparse matrix
             Randomized version of the subjac.
         """
         if isinstance(subjac, sparse_types):  # sparse
             sparse = subjac.copy()
-            sparse.data = self._randgen.random(sparse.data.size)
-            sparse.data += 1.0
+            sparse.data = self._randgen.uniform(1.0, 2.0, size=sparse.data.size)
             return sparse
 
         # if a subsystem has computed a dynamic partial or semi-total coloring,
@@ -289,13 +312,16 @@ class Jacobian(object):
         if 'sparsity' in subjac_info:
             assert subjac_info['rows'] is None
             rows, cols, shape = subjac_info['sparsity']
-            r = np.zeros(shape)
-            val = self._randgen.random(len(rows))
-            val += 1.0
-            r[rows, cols] = val
+            if dense:
+                r = np.zeros(shape)
+                r[rows, cols] = self._randgen.uniform(1.0, 2.0, size=len(rows))
+            else:
+                # keep the randomized subjac sparse so the resulting total jacobian isn't
+                # artificially dense, which would make any total coloring overly conservative.
+                r = coo_matrix((self._randgen.uniform(1.0, 2.0, size=len(rows)), (rows, cols)),
+                               shape=shape)
         else:
-            r = self._randgen.random(subjac.shape)
-            r += 1.0
+            r = self._randgen.uniform(1.0, 2.0, size=subjac.shape)
 
         return r
 
@@ -311,27 +337,50 @@ class Jacobian(object):
         active : bool
             Complex mode flag; set to True prior to commencing complex step.
         """
-        for meta in self._subjacs_info.values():
+        pairs = self._cs_paired_vals
+        for key, meta in self._subjacs_info.items():
+            val = meta['val']
             if active:
-                meta['val'] = meta['val'].astype(complex)
+                if isinstance(val, np.ndarray):
+                    # reuse a preallocated complex buffer for each dense/COO subjac so
+                    # repeated mode toggles don't reallocate every val array.
+                    pair = pairs.get(key)
+                    if pair is None or pair[0] is not val or pair[1].shape != val.shape:
+                        pairs[key] = pair = (val, np.empty(val.shape, dtype=complex))
+                    cval = pair[1]
+                    cval[:] = val
+                    meta['val'] = cval
+                else:
+                    meta['val'] = val.astype(complex)
             else:
-                meta['val'] = meta['val'].real
+                pair = pairs.get(key)
+                if pair is not None and pair[1] is val:
+                    rval = pair[0]
+                    rval[:] = val.real
+                    meta['val'] = rval
+                else:
+                    meta['val'] = val.real
 
         self._under_complex_step = active
 
     def _setup_index_maps(self, system):
+        # materialize the of/wrt iterators here since set_col and set_dense_jac would
+        # otherwise regenerate them on every call.
+        self._of_iter_cache = list(system._jac_of_iter())
+        self._wrt_iter_cache = list(system._jac_wrt_iter())
+
         self._col_var_offset = {}
         col_var_info = []
-        for wrt, start, end, _, _, _ in system._jac_wrt_iter():
+        for wrt, start, end, _, _, _ in self._wrt_iter_cache:
             self._col_var_offset[wrt] = start
             col_var_info.append(end)
 
         self._col_varnames = list(self._col_var_offset)
-        self._col2name_ind = np.empty(end, dtype=INT_DTYPE)  # jac col to var id
-        start = 0
-        for i, end in enumerate(col_var_info):
-            self._col2name_ind[start:end] = i
-            start = end
+        # ending col index per var; a col index maps to a var id via binary search, which
+        # avoids allocating an int array of length equal to the total number of columns.
+        self._col_var_ends = np.array(col_var_info, dtype=INT_DTYPE)
+
+        self._wrt_subjac_cache = {}
 
     def set_col(self, system, icol, column):
         """
@@ -354,19 +403,65 @@ class Jacobian(object):
         if self._col_varnames is None:
             self._setup_index_maps(system)
 
-        wrt = self._col_varnames[self._col2name_ind[icol]]
+        wrt = self._col_varnames[np.searchsorted(self._col_var_ends, icol, side='right')]
         loc_idx = icol - self._col_var_offset[wrt]  # local col index into subjacs
 
-        for of, start, end, _, _ in system._jac_of_iter():
-            key = (of, wrt)
-            if key in self._subjacs_info:
-                subjac = self._subjacs_info[key]
+        cache = self._wrt_subjac_cache.get(wrt)
+        if cache is None:
+            cache = self._build_wrt_subjac_cache(wrt)
+
+        dense_subjacs, coo_subjacs = cache
+
+        for subjac, start, end in dense_subjacs:
+            subjac['val'][:, loc_idx] = column[start:end]
+
+        for subjac, order, indptr, abs_rows in coo_subjacs:
+            i0 = indptr[loc_idx]
+            i1 = indptr[loc_idx + 1]
+            if i0 != i1:
+                subjac['val'][order[i0:i1]] = column[abs_rows[i0:i1]]
+
+    def _build_wrt_subjac_cache(self, wrt):
+        """
+        Build lists of (subjac, row start, row end) for all subjacs of the given wrt variable.
+
+        Dense and COO subjacs are collected into separate lists so set_col doesn't re-check
+        the subjac format for every column, and each COO entry gets its nonzeros sorted by
+        column along with a CSC style indptr, so a column's entries are found with two int
+        lookups and two slices instead of an equality scan over the full cols array.
+
+        Parameters
+        ----------
+        wrt : str
+            Name of the column variable.
+
+        Returns
+        -------
+        tuple of (list, list)
+            Lists of dense and COO subjac entries for the given wrt variable.
+        """
+        for w, wstart, wend, _, _, _ in self._wrt_iter_cache:
+            if w == wrt:
+                ncols = wend - wstart
+                break
+
+        dense_subjacs = []
+        coo_subjacs = []
+        for of, start, end, _, _ in self._of_iter_cache:
+            subjac = self._subjacs_info.get((of, wrt))
+            if subjac is not None:
                 if subjac['cols'] is None:  # dense
-                    subjac['val'][:, loc_idx] = column[start:end]
+                    dense_subjacs.append((subjac, start, end))
                 else:  # our COO format
-                    match_inds = np.nonzero(subjac['cols'] == loc_idx)[0]
-                    if match_inds.size > 0:
-                        subjac['val'][match_inds] = column[start:end][subjac['rows'][match_inds]]
+                    order = np.argsort(subjac['cols'], kind='stable')
+                    sorted_cols = subjac['cols'][order]
+                    indptr = np.searchsorted(sorted_cols, np.arange(ncols + 1))
+                    # store row indices offset into the full column so the gather in
+                    # set_col needs no intermediate column[start:end] slice
+                    coo_subjacs.append((subjac, order, indptr, subjac['rows'][order] + start))
+
+        self._wrt_subjac_cache[wrt] = cache = (dense_subjacs, coo_subjacs)
+        return cache
 
     def set_dense_jac(self, system, jac):
         """
@@ -385,17 +480,17 @@ class Jacobian(object):
         if self._col_varnames is None:
             self._setup_index_maps(system)
 
-        wrtiter = list(system._jac_wrt_iter())
-        for of, start, end, _, _ in system._jac_of_iter():
+        wrtiter = self._wrt_iter_cache
+        subjacs_info = self._subjacs_info
+        for of, start, end, _, _ in self._of_iter_cache:
             for wrt, wstart, wend, _, _, _ in wrtiter:
-                key = (of, wrt)
-                if key in self._subjacs_info:
-                    subjac = self._subjacs_info[key]
+                subjac = subjacs_info.get((of, wrt))
+                if subjac is not None:
                     if subjac['cols'] is None:  # dense
-                        subjac['val'][:, :] = jac[start:end, wstart:wend]
+                        np.copyto(subjac['val'], jac[start:end, wstart:wend])
                     else:  # our COO format
                         subj = jac[start:end, wstart:wend]
-                        subjac['val'][:] = subj[subjac['rows'], subjac['cols']]
+                        np.copyto(subjac['val'], subj[subjac['rows'], subjac['cols']])
 
     def _restore_approx_sparsity(self):
         """
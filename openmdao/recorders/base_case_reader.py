@@ -40,6 +40,12 @@ class BaseCaseReader(object):
         self.solver_metadata = {}
         self._system_options = {}
 
+    def close(self):
+        """
+        Close any connections the reader holds to the recorded data.
+        """
+        pass
+
     @property
     def openmdao_version(self):
         """
@@ -1,6 +1,8 @@
 """
 Class definition for CaseRecorder, the base class for all recorders.
 """
+import pickle
+
 from openmdao.core.system import System
 from openmdao.core.driver import Driver
 from openmdao.solvers.solver import Solver
@@ -10,8 +12,10 @@ from openmdao.utils.options_dictionary import OptionsDictionary
 from openmdao.utils.record_util import check_path
 
 
-# default pickle protocol version for serialization
-PICKLE_VER = 4
+# default pickle protocol version for serialization. The highest protocol (5 on all
+# supported Pythons) handles large numpy buffers without an extra copy and produces
+# smaller blobs than older protocols.
+PICKLE_VER = pickle.HIGHEST_PROTOCOL
 
 
 class CaseRecorder(object):
@@ -3,7 +3,6 @@ Definition of the SqliteCaseReader.
 """
 import importlib
 import sqlite3
-from collections import OrderedDict
 
 import os
 import sys
@@ -126,6 +125,9 @@ class SqliteCaseReader(BaseCaseReader):
         Helper object for accessing cases from the problem_cases table.
     _global_iterations : list
         List of iteration cases and the table and row in which they are found.
+    _source_vars_cache : dict
+        Map of source name to the variables recorded by that source, so repeated
+        calls to list_source_vars don't have to decode a case for each call.
     """
 
     def __init__(self, filename, pre_load=False, metadata_filename=None):
@@ -145,6 +147,7 @@ class SqliteCaseReader(BaseCaseReader):
         self._conns = None
         self._auto_ivc_map = {}
         self._global_iterations = None
+        self._source_vars_cache = {}
 
         with sqlite3.connect(filename) as con:
             con.row_factory = sqlite3.Row
@@ -218,6 +221,24 @@ class SqliteCaseReader(BaseCaseReader):
         if pre_load:
             self._load_cases()
 
+    def close(self):
+        """
+        Close the reader's connections to the database.
+
+        The reader remains usable after calling this; the case tables will reconnect
+        as needed on the next query.
+        """
+        for attr in ('_driver_cases', '_system_cases', '_solver_cases', '_problem_cases'):
+            table = getattr(self, attr, None)
+            if table is not None:
+                table.close()
+
+    def __del__(self):
+        """
+        Close database connections when the reader is garbage collected.
+        """
+        self.close()
+
     def _collect_metadata(self, cur):
         """
         Load data from the metadata table.
@@ -480,6 +501,16 @@ class SqliteCaseReader(BaseCaseReader):
         dict
             {'inputs':[key list], 'outputs':[key list], 'residuals':[key list]}. No recurse.
         """
+        if source in self._source_vars_cache:
+            # decoding a case to enumerate its variables is expensive, so do it only once
+            # per source and serve repeated calls from the cache
+            dct = {key: list(val) for key, val in self._source_vars_cache[source].items()}
+
+            if out_stream:
+                write_source_table(dct, out_stream)
+
+            return dct
+
         dct = {
             'inputs': [],
             'outputs': [],
@@ -513,6 +544,8 @@ class SqliteCaseReader(BaseCaseReader):
         if case.residuals:
             dct['residuals'] = list(case.residuals)
 
+        self._source_vars_cache[source] = {key: list(val) for key, val in dct.items()}
+
         if out_stream:
             write_source_table(dct, out_stream)
 
@@ -682,7 +715,7 @@ class SqliteCaseReader(BaseCaseReader):
         recurse : bool, optional
             If True, will enable iterating over all successors in case hierarchy.
         flat : bool, optional
-            If False and there are child cases, then a nested ordered dictionary
+            If False and there are child cases, then a nested dictionary
             is returned rather than an iterator.
         out_stream : file-like object
             Where to send human readable output. Default is sys.stdout.
@@ -747,7 +780,7 @@ class SqliteCaseReader(BaseCaseReader):
                         cases += self._list_cases_recurse_flat(case.name, out_stream=None)
                 else:
                     # return nested dict of cases from the source and child cases
-                    cases = OrderedDict()
+                    cases = {}
                     source_cases = case_table.get_cases(source)
                     for case in source_cases:
                         cases.update(self._list_cases_recurse_nested(case.name))
@@ -886,8 +919,8 @@ class SqliteCaseReader(BaseCaseReader):
         else:
             raise RuntimeError('Case not found for coordinate:', coord)
 
-        cases = OrderedDict()
-        children = OrderedDict()
+        cases = {}
+        children = {}
         cases[parent_case.name] = children
 
         # return all cases in the global iteration table that precede the given case
@@ -921,7 +954,7 @@ class SqliteCaseReader(BaseCaseReader):
         recurse : bool, optional
             If True, will enable iterating over all successors in case hierarchy.
         flat : bool, optional
-            If False and there are child cases, then a nested ordered dictionary
+            If False and there are child cases, then a nested dictionary
             is returned rather than an iterator.
 
         Returns
@@ -933,7 +966,7 @@ class SqliteCaseReader(BaseCaseReader):
         if isinstance(case_ids, list):
             return [self.get_case(case_id) for case_id in case_ids]
         else:
-            return self._get_cases_nested(case_ids, OrderedDict())
+            return self._get_cases_nested(case_ids, {})
 
     def _get_cases_nested(self, case_ids, cases):
         """
@@ -941,23 +974,23 @@ class SqliteCaseReader(BaseCaseReader):
 
         Parameters
         ----------
-        case_ids : OrderedDict
+        case_ids : dict
             The nested dictionary of case IDs.
-        cases : OrderedDict
+        cases : dict
             The nested dictionary of cases.
 
         Returns
         -------
-        OrderedDict
+        dict
             The nested dictionary of cases with cases added from case_ids.
         """
         for case_id in case_ids:
             case = self.get_case(case_id)
             children = case_ids[case_id]
             if len(children.keys()) > 0:
-                cases[case] = self._get_cases_nested(children, OrderedDict())
+                cases[case] = self._get_cases_nested(children, {})
             else:
-                cases[case] = OrderedDict()
+                cases[case] = {}
 
         return cases
 
@@ -1073,6 +1106,8 @@ class CaseTable(object):
         connections or a promoted input name for multiple connections. This is for output display.
     _global_iterations : list
         List of iteration cases and the table and row in which they are found.
+    _con : sqlite3.Connection or None
+        Long-lived read connection to the database, created on first use.
     """
 
     def __init__(self, fname, ver, table, index, giter, prom2abs, abs2prom, abs2meta, conns,
@@ -1081,6 +1116,7 @@ class CaseTable(object):
         Initialize.
         """
         self._filename = fname
+        self._con = None
         self._format_version = ver
         self._table_name = table
         self._index_name = index
@@ -1097,6 +1133,32 @@ class CaseTable(object):
         self._keys = None
         self._cases = {}
 
+    def _cursor(self):
+        """
+        Get a cursor on the database, connecting if necessary.
+
+        The connection is kept open and reused, so repeated queries against the table reuse
+        sqlite's page cache and compiled-statement cache rather than paying the connect and
+        prepare cost on every call.
+
+        Returns
+        -------
+        sqlite3.Cursor
+            Cursor on the recording database.
+        """
+        if self._con is None:
+            self._con = sqlite3.connect(self._filename, cached_statements=256)
+            self._con.row_factory = sqlite3.Row
+        return self._con.cursor()
+
+    def close(self):
+        """
+        Close the read connection to the database, if one has been opened.
+        """
+        if self._con is not None:
+            self._con.close()
+            self._con = None
+
     def count(self):
         """
         Get the number of cases recorded in the table.
@@ -1106,12 +1168,9 @@ class CaseTable(object):
         int
             The number of cases recorded in the table.
         """
-        with sqlite3.connect(self._filename) as con:
-            cur = con.cursor()
-            cur.execute(f"SELECT count(*) FROM {self._table_name}")  # nosec: trusted input
-            rows = cur.fetchall()
-
-        con.close()
+        cur = self._cursor()
+        cur.execute(f"SELECT count(*) FROM {self._table_name}")  # nosec: trusted input
+        rows = cur.fetchall()
 
         return rows[0][0]
 
@@ -1131,16 +1190,12 @@ class CaseTable(object):
             The cases from the table from the specified source or parent case.
         """
         if not self._keys:
-            with sqlite3.connect(self._filename) as con:
-                cur = con.cursor()
-                cur.execute(f"SELECT {self._index_name} FROM {self._table_name}"
-                            " ORDER BY id ASC")  # nosec trusted input
-                rows = cur.fetchall()
-
-            con.close()
+            cur = self._cursor()
+            cur.execute(f"SELECT {self._index_name} FROM {self._table_name}"
+                        " ORDER BY id ASC")  # nosec trusted input
 
             # cache case list for future use
-            self._keys = [row[0] for row in rows]
+            self._keys = [row[0] for row in cur.fetchall()]
 
         if not source:
             # return all cases
@@ -1163,7 +1218,7 @@ class CaseTable(object):
         recurse : bool, optional
             If True, will enable iterating over all successors in case hierarchy.
         flat : bool, optional
-            If False and there are child cases, then a nested ordered dictionary
+            If False and there are child cases, then a nested dictionary
             is returned rather than an iterator.
 
         Returns
@@ -1180,7 +1235,7 @@ class CaseTable(object):
         elif '|' in source:
             # source is a coordinate
             if recurse and not flat:
-                cases = OrderedDict()
+                cases = {}
                 for key in self._keys:
                     if len(key) > len(source) and key.startswith(source):
                         cases[key] = self.get_cases(key, recurse, flat)
@@ -1196,7 +1251,7 @@ class CaseTable(object):
                     return list([self.get_case(key) for key in self._keys
                                  if get_source_system(key).startswith(source_sys)])
                 else:
-                    cases = OrderedDict()
+                    cases = {}
                     for key in self._keys:
                         case_source = self._get_source(key)
                         if case_source == source:
@@ -1231,14 +1286,10 @@ class CaseTable(object):
             return self._cases[case_id]
 
         # we don't have it, so fetch it
-        with sqlite3.connect(self._filename) as con:
-            con.row_factory = sqlite3.Row
-            cur = con.cursor()
-            cur.execute(f"SELECT * FROM {self._table_name} "  # nosec: trusted input
-                        f"WHERE {self._index_name}=?", (case_id, ))
-            row = cur.fetchone()
-
-        con.close()
+        cur = self._cursor()
+        cur.execute(f"SELECT * FROM {self._table_name} "  # nosec: trusted input
+                    f"WHERE {self._index_name}=?", (case_id, ))
+        row = cur.fetchone()
 
         # if found, extract the data and optionally cache the Case
         if row is not None:
@@ -1298,21 +1349,16 @@ class CaseTable(object):
         ------
         case
         """
-        with sqlite3.connect(self._filename) as con:
-            con.row_factory = sqlite3.Row
-            cur = con.cursor()
-            cur.execute(f"SELECT * FROM {self._table_name} ORDER BY id ASC")  # nosec: trusted input
-            # rows = cur.fetchall()
-            for row in cur:
-                case_id = row[self._index_name]
-                source = self._get_source(case_id)
-                case = Case(source, row, self._prom2abs, self._abs2prom, self._abs2meta,
-                            self._conns, self._auto_ivc_map, self._var_info, self._format_version)
-                if cache:
-                    self._cases[case_id] = case
-                yield case
-
-        con.close()
+        cur = self._cursor()
+        cur.execute(f"SELECT * FROM {self._table_name} ORDER BY id ASC")  # nosec: trusted input
+        for row in cur:
+            case_id = row[self._index_name]
+            source = self._get_source(case_id)
+            case = Case(source, row, self._prom2abs, self._abs2prom, self._abs2meta,
+                        self._conns, self._auto_ivc_map, self._var_info, self._format_version)
+            if cache:
+                self._cases[case_id] = case
+            yield case
 
     def _load_cases(self):
         """
@@ -1461,33 +1507,29 @@ class DriverCases(CaseTable):
         ------
         case
         """
-        with sqlite3.connect(self._filename) as con:
-            con.row_factory = sqlite3.Row
-            cur = con.cursor()
-            cur.execute(f"SELECT * FROM {self._table_name} ORDER BY id ASC")  # nosec: trusted input
-            rows = cur.fetchall()
-
-            for row in rows:
-                if self._format_version > 1:
-                    # fetch associated derivative data, if available
-                    cur.execute("SELECT * FROM driver_derivatives WHERE iteration_coordinate=?",
-                                (row['iteration_coordinate'], ))
-                    derivs_row = cur.fetchone()
+        cur = self._cursor()
+        cur.execute(f"SELECT * FROM {self._table_name} ORDER BY id ASC")  # nosec: trusted input
+        rows = cur.fetchall()
 
-                    if derivs_row:
-                        # convert row to a regular dict and add jacobian
-                        row = dict(zip(row.keys(), row))
-                        row['jacobian'] = derivs_row['derivatives']
+        for row in rows:
+            if self._format_version > 1:
+                # fetch associated derivative data, if available
+                cur.execute("SELECT * FROM driver_derivatives WHERE iteration_coordinate=?",
+                            (row['iteration_coordinate'], ))
+                derivs_row = cur.fetchone()
 
-                case = Case('driver', row, self._prom2abs, self._abs2prom, self._abs2meta,
-                            self._conns, self._auto_ivc_map, self._var_info, self._format_version)
+                if derivs_row:
+                    # convert row to a regular dict and add jacobian
+                    row = dict(zip(row.keys(), row))
+                    row['jacobian'] = derivs_row['derivatives']
 
-                if cache:
-                    self._cases[case.name] = case
+            case = Case('driver', row, self._prom2abs, self._abs2prom, self._abs2meta,
+                        self._conns, self._auto_ivc_map, self._var_info, self._format_version)
 
-                yield case
+            if cache:
+                self._cases[case.name] = case
 
-        con.close()
+            yield case
 
     def get_case(self, case_id, cache=False):
         """
@@ -1514,28 +1556,25 @@ class DriverCases(CaseTable):
             return self._cases[case_id]
 
         # Get an unscaled case if does not already exist in _cases
-        with sqlite3.connect(self._filename) as con:
-            con.row_factory = sqlite3.Row
-            cur = con.cursor()
+        cur = self._cursor()
+
+        # fetch driver iteration data
+        cur.execute("SELECT * FROM driver_iterations WHERE "
+                    "iteration_coordinate=:iteration_coordinate",
+                    {"iteration_coordinate": case_id})
+        row = cur.fetchone()
 
-            # fetch driver iteration data
-            cur.execute("SELECT * FROM driver_iterations WHERE "
+        # fetch associated derivative data, if available
+        if row and self._format_version > 1:
+            cur.execute("SELECT * FROM driver_derivatives WHERE "
                         "iteration_coordinate=:iteration_coordinate",
                         {"iteration_coordinate": case_id})
-            row = cur.fetchone()
-
-            # fetch associated derivative data, if available
-            if row and self._format_version > 1:
-                cur.execute("SELECT * FROM driver_derivatives WHERE "
-                            "iteration_coordinate=:iteration_coordinate",
-                            {"iteration_coordinate": case_id})
-                derivs_row = cur.fetchone()
+            derivs_row = cur.fetchone()
 
-                if derivs_row:
-                    # convert row to a regular dict and add jacobian
-                    row = dict(zip(row.keys(), row))
-                    row['jacobian'] = derivs_row['derivatives']
-        con.close()
+            if derivs_row:
+                # convert row to a regular dict and add jacobian
+                row = dict(zip(row.keys(), row))
+                row['jacobian'] = derivs_row['derivatives']
 
         # if found, create Case object (and cache it if requested) else return None
         if row:
@@ -68,6 +68,28 @@ format_version = 14
 # separator, cannot be a legal char for names
 META_KEY_SEP = '!'
 
+# INSERT statements for the case tables, used when flushing buffered rows
+_INSERT_SQL = {
+    'driver_iterations': "INSERT INTO driver_iterations(counter, iteration_coordinate, "
+                         "timestamp, success, msg, inputs, outputs, residuals) "
+                         "VALUES(?,?,?,?,?,?,?,?)",
+    'driver_derivatives': "INSERT INTO driver_derivatives(counter, iteration_coordinate, "
+                          "timestamp, success, msg, derivatives) VALUES(?,?,?,?,?,?)",
+    'problem_cases': "INSERT INTO problem_cases(counter, case_name, "
+                     "timestamp, success, msg, inputs, outputs, residuals, jacobian, "
+                     "abs_err, rel_err ) "
+                     "VALUES(?,?,?,?,?,?,?,?,?,?,?)",
+    'system_iterations': "INSERT INTO system_iterations(counter, iteration_coordinate, "
+                         "timestamp, success, msg, inputs , outputs , residuals ) "
+                         "VALUES(?,?,?,?,?,?,?,?)",
+    'solver_iterations': "INSERT INTO solver_iterations(counter, iteration_coordinate, "
+                         "timestamp, success, msg, abs_err, rel_err, "
+                         "solver_inputs, solver_output, solver_residuals) "
+                         "VALUES(?,?,?,?,?,?,?,?,?,?)",
+    'global_iterations': "INSERT INTO global_iterations(record_type, rowid, source) "
+                         "VALUES(?,?,?)",
+}
+
 
 def array_to_blob(array):
     """
@@ -115,6 +137,24 @@ def blob_to_array(blob):
     return np.load(out, allow_pickle=True)
 
 
+def _apply_fast_pragmas(connection):
+    """
+    Configure a sqlite connection for faster writes.
+
+    Recording is a write-dominant workload made up of many small INSERTs, so use
+    write-ahead logging and relaxed syncing to avoid paying the rollback-journal
+    fsync cost on every transaction. The extra '-wal'/'-shm' files are merged back
+    into the database file when the connection is closed.
+
+    Parameters
+    ----------
+    connection : sqlite3.Connection
+        Connection to the sqlite3 database.
+    """
+    connection.executescript("PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL; "
+                             "PRAGMA temp_store=MEMORY; PRAGMA cache_size=-65536;")
+
+
 class SqliteRecorder(CaseRecorder):
     """
     Recorder that saves cases in a sqlite db.
@@ -129,11 +169,15 @@ class SqliteRecorder(CaseRecorder):
         The pickle protocol version to use when pickling metadata.
     record_viewer_data : bool, optional
         If True, record data needed for visualization.
+    record_metadata : bool, optional
+        If True, record the options and scaling info for all systems and solvers.
 
     Attributes
     ----------
     _record_viewer_data : bool
         Flag indicating whether to record data needed to generate N2 diagram.
+    _record_options_metadata : bool
+        Flag indicating whether to record the options and scaling info for systems and solvers.
     connection : sqlite connection object
         Connection to the sqlite3 database.
     metadata_connection : sqlite connection object
@@ -155,9 +199,17 @@ class SqliteRecorder(CaseRecorder):
         Flag indicating whether or not the database has been initialized.
     _started : set
         set of recording requesters for which this recorder has been started.
+    _row_buffers : dict
+        Buffered rows for each case table, written to the database in batches.
+    _row_counts : dict
+        Number of rows written or buffered so far for each case table. Since appending to an
+        existing file is not supported, this matches the ids sqlite will assign to the buffered
+        rows, so buffered case rows can be cross-referenced from global_iterations before they
+        are actually inserted.
     """
 
-    def __init__(self, filepath, append=False, pickle_version=PICKLE_VER, record_viewer_data=True):
+    def __init__(self, filepath, append=False, pickle_version=PICKLE_VER, record_viewer_data=True,
+                 record_metadata=True):
         """
         Initialize the SqliteRecorder.
         """
@@ -167,6 +219,7 @@ class SqliteRecorder(CaseRecorder):
         self.connection = None
         self.metadata_connection = None
         self._record_metadata = True
+        self._record_options_metadata = record_metadata
         self._record_viewer_data = record_viewer_data
 
         self._abs2prom = {'input': {}, 'output': {}}
@@ -176,6 +229,8 @@ class SqliteRecorder(CaseRecorder):
         self._filepath = filepath
         self._database_initialized = False
         self._started = set()
+        self._row_buffers = {table: [] for table in _INSERT_SQL}
+        self._row_counts = dict.fromkeys(_INSERT_SQL, 0)
 
         super().__init__(record_viewer_data)
 
@@ -214,6 +269,7 @@ class SqliteRecorder(CaseRecorder):
                         except OSError:
                             pass
                         self.metadata_connection = sqlite3.connect(metadata_filepath)
+                        _apply_fast_pragmas(self.metadata_connection)
                     else:
                         self._record_metadata = False
         else:
@@ -228,7 +284,12 @@ class SqliteRecorder(CaseRecorder):
             except OSError:
                 pass
 
-            self.connection = sqlite3.connect(filepath)
+            # isolation_level=None puts the connection in autocommit mode, so sqlite3
+            # doesn't open an implicit transaction around every statement; case rows are
+            # written inside explicit transactions in _flush_row_buffers instead.
+            self.connection = sqlite3.connect(filepath, isolation_level=None,
+                                              cached_statements=256)
+            _apply_fast_pragmas(self.connection)
             if self._record_metadata and self.metadata_connection is None:
                 self.metadata_connection = self.connection
 
@@ -281,6 +342,54 @@ class SqliteRecorder(CaseRecorder):
         if MPI and comm and comm.size > 1:
             comm.barrier()
 
+    def _buffer_row(self, table, row):
+        """
+        Buffer a row for insertion into the given case table.
+
+        All rows buffered for a single recorded iteration are flushed together, so they are
+        committed in one transaction. Rows cannot be held across iterations because readers
+        may open the database while a run is still in progress.
+
+        Parameters
+        ----------
+        table : str
+            Name of the case table the row belongs to.
+        row : tuple
+            Column values for the row, matching the INSERT statement for the table.
+
+        Returns
+        -------
+        int
+            The id that sqlite will assign to the row when it is inserted.
+        """
+        self._row_buffers[table].append(row)
+        self._row_counts[table] += 1
+
+        return self._row_counts[table]
+
+    def _flush_row_buffers(self):
+        """
+        Write all buffered case rows to the database in a single transaction.
+        """
+        if not any(self._row_buffers.values()):
+            # nothing to write (and the connection may already be closed if this
+            # is a repeated shutdown call)
+            return
+
+        # the connection is in autocommit mode, so open the transaction explicitly;
+        # BEGIN IMMEDIATE takes the write lock up front rather than on the first insert
+        self.connection.execute("BEGIN IMMEDIATE")
+        try:
+            for table, rows in self._row_buffers.items():
+                if rows:
+                    self.connection.executemany(_INSERT_SQL[table], rows)
+                    rows.clear()
+        except Exception:
+            self.connection.execute("ROLLBACK")
+            raise
+        else:
+            self.connection.execute("COMMIT")
+
     def _cleanup_abs2meta(self):
         """
         Convert all abs2meta variable properties to a form that can be dumped as JSON.
@@ -508,18 +617,13 @@ class SqliteRecorder(CaseRecorder):
             inputs_text = json.dumps(inputs)
             residuals_text = json.dumps(residuals)
 
-            with self.connection as c:
-                c = c.cursor()  # need a real cursor for lastrowid
-
-                c.execute("INSERT INTO driver_iterations(counter, iteration_coordinate, "
-                          "timestamp, success, msg, inputs, outputs, residuals) "
-                          "VALUES(?,?,?,?,?,?,?,?)",
-                          (self._counter, self._iteration_coordinate,
-                           metadata['timestamp'], metadata['success'], metadata['msg'],
-                           inputs_text, outputs_text, residuals_text))
+            rowid = self._buffer_row('driver_iterations',
+                                     (self._counter, self._iteration_coordinate,
+                                      metadata['timestamp'], metadata['success'], metadata['msg'],
+                                      inputs_text, outputs_text, residuals_text))
 
-                c.execute("INSERT INTO global_iterations(record_type, rowid, source) VALUES(?,?,?)",
-                          ('driver', c.lastrowid, driver._get_name()))
+            self._buffer_row('global_iterations', ('driver', rowid, driver._get_name()))
+            self._flush_row_buffers()
 
     def record_iteration_problem(self, problem, data, metadata):
         """
@@ -568,20 +672,14 @@ class SqliteRecorder(CaseRecorder):
             abs_err = data['abs']
             rel_err = data['rel']
 
-            with self.connection as c:
-                c = c.cursor()  # need a real cursor for lastrowid
-
-                c.execute("INSERT INTO problem_cases(counter, case_name, "
-                          "timestamp, success, msg, inputs, outputs, residuals, jacobian, "
-                          "abs_err, rel_err ) "
-                          "VALUES(?,?,?,?,?,?,?,?,?,?,?)",
-                          (self._counter, metadata['name'],
-                           metadata['timestamp'], metadata['success'], metadata['msg'],
-                           inputs_text, outputs_text, residuals_text, totals_blob,
-                           abs_err, rel_err))
+            rowid = self._buffer_row('problem_cases',
+                                     (self._counter, metadata['name'],
+                                      metadata['timestamp'], metadata['success'], metadata['msg'],
+                                      inputs_text, outputs_text, residuals_text, totals_blob,
+                                      abs_err, rel_err))
 
-                c.execute("INSERT INTO global_iterations(record_type, rowid, source) VALUES(?,?,?)",
-                          ('problem', c.lastrowid, metadata['name']))
+            self._buffer_row('global_iterations', ('problem', rowid, metadata['name']))
+            self._flush_row_buffers()
 
     def record_iteration_system(self, system, data, metadata):
         """
@@ -616,23 +714,18 @@ class SqliteRecorder(CaseRecorder):
             inputs_text = json.dumps(inputs)
             residuals_text = json.dumps(residuals)
 
-            with self.connection as c:
-                c = c.cursor()  # need a real cursor for lastrowid
-
-                c.execute("INSERT INTO system_iterations(counter, iteration_coordinate, "
-                          "timestamp, success, msg, inputs , outputs , residuals ) "
-                          "VALUES(?,?,?,?,?,?,?,?)",
-                          (self._counter, self._iteration_coordinate,
-                           metadata['timestamp'], metadata['success'], metadata['msg'],
-                           inputs_text, outputs_text, residuals_text))
+            rowid = self._buffer_row('system_iterations',
+                                     (self._counter, self._iteration_coordinate,
+                                      metadata['timestamp'], metadata['success'], metadata['msg'],
+                                      inputs_text, outputs_text, residuals_text))
 
-                # get the pathname of the source system
-                source_system = system.pathname
-                if source_system == '':
-                    source_system = 'root'
+            # get the pathname of the source system
+            source_system = system.pathname
+            if source_system == '':
+                source_system = 'root'
 
-                c.execute("INSERT INTO global_iterations(record_type, rowid, source) VALUES(?,?,?)",
-                          ('system', c.lastrowid, source_system))
+            self._buffer_row('global_iterations', ('system', rowid, source_system))
+            self._flush_row_buffers()
 
     def record_iteration_solver(self, solver, data, metadata):
         """
@@ -671,34 +764,28 @@ class SqliteRecorder(CaseRecorder):
             inputs_text = json.dumps(inputs)
             residuals_text = json.dumps(residuals)
 
-            with self.connection as c:
-                c = c.cursor()  # need a real cursor for lastrowid
-
-                c.execute("INSERT INTO solver_iterations(counter, iteration_coordinate, "
-                          "timestamp, success, msg, abs_err, rel_err, "
-                          "solver_inputs, solver_output, solver_residuals) "
-                          "VALUES(?,?,?,?,?,?,?,?,?,?)",
-                          (self._counter, self._iteration_coordinate,
-                           metadata['timestamp'], metadata['success'], metadata['msg'],
-                           abs, rel, inputs_text, outputs_text, residuals_text))
-
-                # get the pathname of the source system
-                source_system = solver._system().pathname
-                if source_system == '':
-                    source_system = 'root'
-
-                # get solver type from SOLVER class attribute to determine the solver pathname
-                solver_type = solver.SOLVER[0:2]
-                if solver_type == 'NL':
-                    source_solver = source_system + '.nonlinear_solver'
-                elif solver_type == 'LS':
-                    source_solver = source_system + '.nonlinear_solver.linesearch'
-                else:
-                    raise RuntimeError("Solver type '%s' not recognized during recording. "
-                                       "Expecting NL or LS" % solver.SOLVER)
+            # get the pathname of the source system
+            source_system = solver._system().pathname
+            if source_system == '':
+                source_system = 'root'
+
+            # get solver type from SOLVER class attribute to determine the solver pathname
+            solver_type = solver.SOLVER[0:2]
+            if solver_type == 'NL':
+                source_solver = source_system + '.nonlinear_solver'
+            elif solver_type == 'LS':
+                source_solver = source_system + '.nonlinear_solver.linesearch'
+            else:
+                raise RuntimeError("Solver type '%s' not recognized during recording. "
+                                   "Expecting NL or LS" % solver.SOLVER)
 
-                c.execute("INSERT INTO global_iterations(record_type, rowid, source) VALUES(?,?,?)",
-                          ('solver', c.lastrowid, source_solver))
+            rowid = self._buffer_row('solver_iterations',
+                                     (self._counter, self._iteration_coordinate,
+                                      metadata['timestamp'], metadata['success'], metadata['msg'],
+                                      abs, rel, inputs_text, outputs_text, residuals_text))
+
+            self._buffer_row('global_iterations', ('solver', rowid, source_solver))
+            self._flush_row_buffers()
 
     def record_viewer_data(self, model_viewer_data, key='Driver'):
         """
@@ -734,7 +821,7 @@ class SqliteRecorder(CaseRecorder):
             Number indicating which run the metadata is associated with.
             None for the first run, 1 for the second, etc.
         """
-        if self._record_metadata and self.metadata_connection:
+        if self._record_metadata and self._record_options_metadata and self.metadata_connection:
 
             scaling_vecs, user_options = self._get_metadata_system(system)
 
@@ -787,7 +874,7 @@ class SqliteRecorder(CaseRecorder):
             Number indicating which run the metadata is associated with.
             None for the first run, 1 for the second, etc.
         """
-        if self._record_metadata and self.metadata_connection:
+        if self._record_metadata and self._record_options_metadata and self.metadata_connection:
             path = solver._system().pathname
             solver_class = type(solver).__name__
 
@@ -823,19 +910,30 @@ class SqliteRecorder(CaseRecorder):
             data_array = dict_to_structured_array(data)
             data_blob = array_to_blob(data_array)
 
-            with self.connection as c:
-                c = c.cursor()  # need a real cursor for lastrowid
-
-                c.execute("INSERT INTO driver_derivatives(counter, iteration_coordinate, "
-                          "timestamp, success, msg, derivatives) VALUES(?,?,?,?,?,?)",
-                          (self._counter, self._iteration_coordinate,
-                           metadata['timestamp'], metadata['success'], metadata['msg'],
-                           data_blob))
+            self._buffer_row('driver_derivatives',
+                             (self._counter, self._iteration_coordinate,
+                              metadata['timestamp'], metadata['success'], metadata['msg'],
+                              data_blob))
+            self._flush_row_buffers()
 
     def shutdown(self):
         """
         Shut down the recorder.
         """
+        # write out any remaining buffered case rows
+        if self.connection:
+            self._flush_row_buffers()
+
+            # update the query planner statistics for the iteration_coordinate indexes
+            # now that the bulk of the inserts is done, so point lookups by coordinate
+            # in the case reader use the indexes effectively
+            try:
+                self.connection.execute("PRAGMA optimize")
+            except sqlite3.ProgrammingError:
+                # shutdown is called once per recording requester; the connection
+                # is already closed after the first call
+                pass
+
         # close database connection
         if self._record_metadata and self.metadata_connection and \
                 self.metadata_connection != self.connection:
@@ -855,6 +953,11 @@ class SqliteRecorder(CaseRecorder):
         Delete all the recordings.
         """
         if self.connection:
+            # discard buffered rows and restart row ids, since the tables will be empty
+            for rows in self._row_buffers.values():
+                rows.clear()
+            self._row_counts = dict.fromkeys(_INSERT_SQL, 0)
+
             self.connection.execute("DELETE FROM global_iterations")
             self.connection.execute("DELETE FROM driver_iterations")
             self.connection.execute("DELETE FROM driver_derivatives")
@@ -6,8 +6,8 @@ import sys
 import unittest
 
 from io import StringIO
-from tempfile import mkstemp
-from collections import OrderedDict
+from tempfile import mkstemp, mkdtemp
+from shutil import rmtree
 
 import numpy as np
 
@@ -45,19 +45,35 @@ def count_keys(d):
 
     Parameters
     ----------
-    d: nested OrderedDict
+    d: nested dict
         The dictionary of cases to be counted.
     """
     count = 0
+    stack = [d]
 
-    for k in d:
-        count += 1
-        if isinstance(d[k], OrderedDict):
-            count += count_keys(d[k])
+    while stack:
+        node = stack.pop()
+        count += len(node)
+        for val in node.values():
+            if isinstance(val, dict):
+                stack.append(val)
 
     return count
 
 
+# expected coordinates of the driver cases recorded in the pyOptSparse child-case tests;
+# these never change, so build them once at import time
+_PYOPT_SLSQP_COORDS = tuple(f'rank0:pyOptSparse_SLSQP|{i}' for i in range(7))
+
+# the same cases when traversed recursively (children before their parent)
+_PYOPT_SLSQP_FLAT_COORDS = tuple(
+    coord for i in range(7) for coord in (
+        f'rank0:pyOptSparse_SLSQP|{i}|root._solve_nonlinear|{i}|NLRunOnce|0',
+        f'rank0:pyOptSparse_SLSQP|{i}|root._solve_nonlinear|{i}',
+        f'rank0:pyOptSparse_SLSQP|{i}',
+    ))
+
+
 class SellarDerivativesGroupedPreAutoIVC(om.Group):
     """
     This version is needed for testing backwards compatibility for load_case on pre-3.2
@@ -150,6 +166,25 @@ class TestSqliteCaseReader(unittest.TestCase):
         self.assertEqual(cr._format_version, format_version,
                          msg='format version not read correctly')
 
+    def test_close(self):
+        prob = SellarProblem()
+        prob.model.add_recorder(self.recorder)
+        prob.setup()
+        prob.run_driver()
+        prob.cleanup()
+
+        cr = om.CaseReader(self.filename, pre_load=False)
+        num_cases = len(cr.list_cases('root', out_stream=None))
+        self.assertTrue(num_cases > 0)
+
+        # close() should release the database so the file can be removed,
+        # and the reader should reconnect if it is used again
+        cr.close()
+        for table in (cr._driver_cases, cr._system_cases, cr._solver_cases, cr._problem_cases):
+            self.assertTrue(table._con is None)
+
+        self.assertEqual(len(cr.list_cases('root', out_stream=None)), num_cases)
+
     def test_reader_instantiates(self):
         """ Test that CaseReader returns an SqliteCaseReader. """
         prob = SellarProblem()
@@ -293,8 +328,9 @@ class TestSqliteCaseReader(unittest.TestCase):
         np.testing.assert_almost_equal(last_case.outputs['x'], [-0.00309521], decimal=2)
 
         # Test to see if the case keys (iteration coords) come back correctly
-        for i, iter_coord in enumerate(driver_cases):
-            self.assertEqual(iter_coord, 'rank0:ScipyOptimize_SLSQP|{}'.format(i))
+        self.assertListEqual(driver_cases,
+                             [f'rank0:ScipyOptimize_SLSQP|{i}'
+                              for i in range(len(driver_cases))])
 
     def test_driver_reading_outputs(self):
 
@@ -326,8 +362,9 @@ class TestSqliteCaseReader(unittest.TestCase):
         # Test values from the last case
         driver_cases = cr.list_cases('driver', out_stream=None)
         last_case = cr.get_case(driver_cases[-1])
-        np.testing.assert_almost_equal(last_case.outputs['f_xy'], prob['f_xy'])
-        np.testing.assert_almost_equal(last_case.outputs['x'], prob['x'])
+        np.testing.assert_almost_equal(np.hstack([last_case.outputs['f_xy'],
+                                                  last_case.outputs['x']]),
+                                       np.hstack([prob['f_xy'], prob['x']]))
 
     def test_driver_reading_residuals(self):
 
@@ -359,8 +396,8 @@ class TestSqliteCaseReader(unittest.TestCase):
         # Test values from the last case
         driver_cases = cr.list_cases('driver', out_stream=None)
         last_case = cr.get_case(driver_cases[-1])
-        np.testing.assert_almost_equal(last_case.residuals['f_xy'], 0.0)
-        np.testing.assert_almost_equal(last_case.residuals['x'], 0.0)
+        np.testing.assert_almost_equal(np.hstack([last_case.residuals['f_xy'],
+                                                  last_case.residuals['x']]), 0.0)
 
     def test_reading_system_cases(self):
         prob = SellarProblem(nonlinear_solver=om.NonlinearBlockGS,
@@ -409,20 +446,21 @@ class TestSqliteCaseReader(unittest.TestCase):
 
         # Test values from cases
         case = cr.get_case('rank0:Driver|0|root._solve_nonlinear|0')
-        np.testing.assert_almost_equal(case.inputs['d1.y2'], [12.05848815, ])
-        np.testing.assert_almost_equal(case.outputs['obj'], [28.58830817, ])
-        np.testing.assert_almost_equal(case.residuals['obj'], [0.0, ],)
+        np.testing.assert_almost_equal(np.hstack([case.inputs['d1.y2'],
+                                                  case.outputs['obj'],
+                                                  case.residuals['obj']]),
+                                       [12.05848815, 28.58830817, 0.0])
 
         # Test to see if the case keys (iteration coords) come back correctly
-        for i, iter_coord in enumerate(cr.list_cases('root.d1', recurse=False, out_stream=None)):
-            self.assertEqual(iter_coord,
-                             'rank0:Driver|0|root._solve_nonlinear|0|NonlinearBlockGS|{iter}|'
-                             'd1._solve_nonlinear|{iter}'.format(iter=i))
+        d1_cases = cr.list_cases('root.d1', recurse=False, out_stream=None)
+        self.assertListEqual(d1_cases,
+                             [f'rank0:Driver|0|root._solve_nonlinear|0|NonlinearBlockGS|{i}|'
+                              f'd1._solve_nonlinear|{i}' for i in range(len(d1_cases))])
 
-        for i, iter_coord in enumerate(cr.list_cases('root.obj_cmp', recurse=False, out_stream=None)):
-            self.assertEqual(iter_coord,
-                             'rank0:Driver|0|root._solve_nonlinear|0|NonlinearBlockGS|{iter}|'
-                             'obj_cmp._solve_nonlinear|{iter}'.format(iter=i))
+        obj_cmp_cases = cr.list_cases('root.obj_cmp', recurse=False, out_stream=None)
+        self.assertListEqual(obj_cmp_cases,
+                             [f'rank0:Driver|0|root._solve_nonlinear|0|NonlinearBlockGS|{i}|'
+                              f'obj_cmp._solve_nonlinear|{i}' for i in range(len(obj_cmp_cases))])
 
     def test_reading_solver_cases(self):
         prob = SellarProblem(nonlinear_solver=om.NonlinearBlockGS,
@@ -455,16 +493,15 @@ class TestSqliteCaseReader(unittest.TestCase):
 
         # Test values from cases
         last_case = cr.get_case(solver_cases[-1])
-        np.testing.assert_almost_equal(last_case.abs_err, [0.0, ])
-        np.testing.assert_almost_equal(last_case.rel_err, [0.0, ])
-        np.testing.assert_almost_equal(last_case.outputs['x'], [1.0, ])
-        np.testing.assert_almost_equal(last_case.residuals['con2'], [0.0, ])
+        np.testing.assert_almost_equal(np.hstack([last_case.abs_err, last_case.rel_err,
+                                                  last_case.outputs['x'],
+                                                  last_case.residuals['con2']]),
+                                       [0.0, 0.0, 1.0, 0.0])
 
         # check that the case keys (iteration coords) come back correctly
-        for i, iter_coord in enumerate(solver_cases):
-            iter_num = i + 1
-            self.assertEqual(iter_coord,
-                             'rank0:Driver|0|root._solve_nonlinear|0|NonlinearBlockGS|%d' % iter_num)
+        self.assertListEqual(solver_cases,
+                             [f'rank0:Driver|0|root._solve_nonlinear|0|NonlinearBlockGS|{i + 1}'
+                              for i in range(len(solver_cases))])
 
     def test_reading_solver_metadata(self):
         prob = SellarProblem(nonlinear_solver=om.NonlinearBlockGS,
@@ -513,9 +550,10 @@ class TestSqliteCaseReader(unittest.TestCase):
         driver_cases = cr.list_cases('driver', out_stream=None)
         last_case = cr.get_case(driver_cases[-1])
 
-        np.testing.assert_almost_equal(last_case.outputs['z'], prob['z'])
-        np.testing.assert_almost_equal(last_case.outputs['x'], prob['x'])
-        np.testing.assert_almost_equal(last_case.outputs['y2'], prob['mda.d2.y2'])
+        np.testing.assert_almost_equal(np.hstack([last_case.outputs['z'],
+                                                  last_case.outputs['x'],
+                                                  last_case.outputs['y2']]),
+                                       np.hstack([prob['z'], prob['x'], prob['mda.d2.y2']]))
 
     @unittest.skipIf(OPT is None, "pyoptsparse is not installed")
     @unittest.skipIf(OPTIMIZER is None, "pyoptsparse is not providing SNOPT or SLSQP")
@@ -542,15 +580,7 @@ class TestSqliteCaseReader(unittest.TestCase):
         cr = om.CaseReader(self.filename)
 
         # check driver cases
-        expected_coords = [
-            'rank0:pyOptSparse_SLSQP|0',
-            'rank0:pyOptSparse_SLSQP|1',
-            'rank0:pyOptSparse_SLSQP|2',
-            'rank0:pyOptSparse_SLSQP|3',
-            'rank0:pyOptSparse_SLSQP|4',
-            'rank0:pyOptSparse_SLSQP|5',
-            'rank0:pyOptSparse_SLSQP|6'
-        ]
+        expected_coords = _PYOPT_SLSQP_COORDS
 
         last_counter = 0
         for i, c in enumerate(cr.get_cases(flat=False)):
@@ -561,29 +591,7 @@ class TestSqliteCaseReader(unittest.TestCase):
         self.assertEqual(i+1, len(expected_coords))
 
         # check driver cases with recursion, flat
-        expected_coords = [
-            'rank0:pyOptSparse_SLSQP|0|root._solve_nonlinear|0|NLRunOnce|0',
-            'rank0:pyOptSparse_SLSQP|0|root._solve_nonlinear|0',
-            'rank0:pyOptSparse_SLSQP|0',
-            'rank0:pyOptSparse_SLSQP|1|root._solve_nonlinear|1|NLRunOnce|0',
-            'rank0:pyOptSparse_SLSQP|1|root._solve_nonlinear|1',
-            'rank0:pyOptSparse_SLSQP|1',
-            'rank0:pyOptSparse_SLSQP|2|root._solve_nonlinear|2|NLRunOnce|0',
-            'rank0:pyOptSparse_SLSQP|2|root._solve_nonlinear|2',
-            'rank0:pyOptSparse_SLSQP|2',
-            'rank0:pyOptSparse_SLSQP|3|root._solve_nonlinear|3|NLRunOnce|0',
-            'rank0:pyOptSparse_SLSQP|3|root._solve_nonlinear|3',
-            'rank0:pyOptSparse_SLSQP|3',
-            'rank0:pyOptSparse_SLSQP|4|root._solve_nonlinear|4|NLRunOnce|0',
-            'rank0:pyOptSparse_SLSQP|4|root._solve_nonlinear|4',
-            'rank0:pyOptSparse_SLSQP|4',
-            'rank0:pyOptSparse_SLSQP|5|root._solve_nonlinear|5|NLRunOnce|0',
-            'rank0:pyOptSparse_SLSQP|5|root._solve_nonlinear|5',
-            'rank0:pyOptSparse_SLSQP|5',
-            'rank0:pyOptSparse_SLSQP|6|root._solve_nonlinear|6|NLRunOnce|0',
-            'rank0:pyOptSparse_SLSQP|6|root._solve_nonlinear|6',
-            'rank0:pyOptSparse_SLSQP|6',
-        ]
+        expected_coords = _PYOPT_SLSQP_FLAT_COORDS
 
         last_counter = 0
         for i, c in enumerate(cr.get_cases(recurse=True, flat=True)):
@@ -598,11 +606,7 @@ class TestSqliteCaseReader(unittest.TestCase):
         self.assertEqual(i+1, len(expected_coords))
 
         # check child cases with recursion, flat
-        expected_coords = [
-            'rank0:pyOptSparse_SLSQP|0|root._solve_nonlinear|0|NLRunOnce|0',
-            'rank0:pyOptSparse_SLSQP|0|root._solve_nonlinear|0',
-            'rank0:pyOptSparse_SLSQP|0',
-        ]
+        expected_coords = _PYOPT_SLSQP_FLAT_COORDS[:3]
 
         last_counter = 0
         for i, c in enumerate(cr.get_cases('rank0:pyOptSparse_SLSQP|0', recurse=True, flat=True)):
@@ -685,132 +689,6 @@ class TestSqliteCaseReader(unittest.TestCase):
 
         self.assertEqual(i, len(expected_coords))
 
-    def test_list_cases_recurse(self):
-        prob = SellarProblem(SellarDerivativesGrouped, nonlinear_solver=om.NonlinearRunOnce,
-                                                       linear_solver=om.ScipyKrylov,
-                                                       mda_nonlinear_solver=om.NonlinearBlockGS)
-        prob.driver = om.ScipyOptimizeDriver(optimizer='SLSQP', tol=1e-9, disp=False)
-        prob.driver.add_recorder(self.recorder)
-        prob.setup()
-
-        model = prob.model
-        model.add_recorder(self.recorder)
-        model.mda.add_recorder(self.recorder)
-        model.nonlinear_solver.add_recorder(self.recorder)
-        model.mda.nonlinear_solver.add_recorder(self.recorder)
-
-        prob.run_driver()
-        prob.cleanup()
-
-        cr = om.CaseReader(self.filename)
-
-        # get total iteration count to check against
-        global_iterations = len(cr._global_iterations)
-
-        #
-        # get a recursive list of all cases (flat)
-        #
-        cases = cr.list_cases(recurse=True, flat=True, out_stream=None)
-
-        # verify the cases are all there
-        self.assertEqual(len(cases), global_iterations)
-
-        # verify the cases are in proper order
-        counter = 0
-        for i, c in enumerate(cr.get_case(case) for case in cases):
-            counter += 1
-            self.assertEqual(c.counter, counter)
-
-        #
-        # get a recursive dict of all cases (nested)
-        #
-        cases = cr.list_cases(recurse=True, flat=False, out_stream=None)
-
-        num_cases = count_keys(cases)
-
-        self.assertEqual(num_cases, global_iterations)
-
-        #
-        # get a recursive list of child cases
-        #
-        parent_coord = 'rank0:ScipyOptimize_SLSQP|0|root._solve_nonlinear|0'
-
-        expected_coords = [
-            parent_coord + '|NLRunOnce|0|mda._solve_nonlinear|0|NonlinearBlockGS|1',
-            parent_coord + '|NLRunOnce|0|mda._solve_nonlinear|0|NonlinearBlockGS|2',
-            parent_coord + '|NLRunOnce|0|mda._solve_nonlinear|0|NonlinearBlockGS|3',
-            parent_coord + '|NLRunOnce|0|mda._solve_nonlinear|0|NonlinearBlockGS|4',
-            parent_coord + '|NLRunOnce|0|mda._solve_nonlinear|0|NonlinearBlockGS|5',
-            parent_coord + '|NLRunOnce|0|mda._solve_nonlinear|0|NonlinearBlockGS|6',
-            parent_coord + '|NLRunOnce|0|mda._solve_nonlinear|0|NonlinearBlockGS|7',
-            parent_coord + '|NLRunOnce|0|mda._solve_nonlinear|0',
-            parent_coord + '|NLRunOnce|0',
-            parent_coord
-        ]
-
-        cases = cr.list_cases(parent_coord, recurse=True, flat=True, out_stream=None)
-
-        # verify the cases are all there and are as expected
-        self.assertEqual(len(cases), len(expected_coords))
-        for i, c in enumerate(cases):
-            self.assertEqual(c, expected_coords[i])
-
-        #
-        # get a list of cases for each source
-        #
-        sources = cr.list_sources(out_stream=None)
-        self.assertEqual(sorted(sources), [
-            'driver', 'root', 'root.mda', 'root.mda.nonlinear_solver', 'root.nonlinear_solver'
-        ])
-
-        # verify the coordinates of the returned cases are all there as expected
-        expected_coord = {
-            'driver':                    r'rank0:ScipyOptimize_SLSQP\|\d',
-            'root':                      r'rank0:ScipyOptimize_SLSQP\|\d\|root._solve_nonlinear\|\d',
-            'root.nonlinear_solver':     r'rank0:ScipyOptimize_SLSQP\|\d\|root._solve_nonlinear\|\d\|NLRunOnce\|0',
-            'root.mda':                  r'rank0:ScipyOptimize_SLSQP\|\d\|root._solve_nonlinear\|\d\|NLRunOnce\|0\|mda._solve_nonlinear\|\d',
-            'root.mda.nonlinear_solver': r'rank0:ScipyOptimize_SLSQP\|\d\|root._solve_nonlinear\|\d\|NLRunOnce\|0\|mda._solve_nonlinear\|\d\|NonlinearBlockGS\|\d',
-        }
-        counter = 0
-        mda_counter = 0
-        root_counter = 0
-        for source in sources:
-            expected = expected_coord[source]
-            cases = cr.list_cases(source, recurse=False, out_stream=None)
-            for case in cases:
-                counter += 1
-                if source.startswith('root.mda'):  # count all cases for/under mda system
-                    mda_counter += 1
-                if source.startswith('root.'):     # count all cases for/under root solver
-                    root_counter += 1
-                self.assertRegex(case, expected)
-
-        self.assertEqual(counter, global_iterations)
-
-        #
-        # get a recursive list of child cases for the mda system
-        #
-        counter = 0
-
-        cases = cr.list_cases('root.mda', recurse=True, flat=True, out_stream=None)
-        for case in cases:
-            self.assertTrue(case.index('|mda._solve_nonlinear|') > 0)
-            counter += 1
-
-        self.assertEqual(counter, mda_counter)
-
-        #
-        # get a recursive list of child cases for the root solver
-        #
-        counter = 0
-
-        cases = cr.list_cases('root.nonlinear_solver', recurse=True, flat=True, out_stream=None)
-        for case in cases:
-            self.assertTrue(case.index('|NLRunOnce|') > 0)
-            counter += 1
-
-        self.assertEqual(counter, root_counter)
-
     def test_list_cases_nested_model(self):
         prob = SellarProblem(SellarDerivativesGrouped, nonlinear_solver=om.NonlinearRunOnce)
         prob.driver = om.ScipyOptimizeDriver(tol=1e-9, disp=False)
@@ -898,128 +776,6 @@ class TestSqliteCaseReader(unittest.TestCase):
 
         self.assertEqual(str(cm.exception), expected_err)
 
-    def test_get_cases_recurse(self):
-        prob = SellarProblem(SellarDerivativesGrouped, nonlinear_solver=om.NonlinearRunOnce,
-                                                       linear_solver=om.ScipyKrylov,
-                                                       mda_nonlinear_solver=om.NonlinearBlockGS)
-        prob.driver = om.ScipyOptimizeDriver(optimizer='SLSQP', tol=1e-9, disp=False)
-        prob.driver.add_recorder(self.recorder)
-        prob.setup()
-
-        model = prob.model
-        model.add_recorder(self.recorder)
-        model.mda.add_recorder(self.recorder)
-        model.nonlinear_solver.add_recorder(self.recorder)
-        model.mda.nonlinear_solver.add_recorder(self.recorder)
-
-        prob.run_driver()
-        prob.cleanup()
-
-        cr = om.CaseReader(self.filename)
-
-        # get total iteration count to check against
-        global_iterations = len(cr._global_iterations)
-
-        #
-        # get a recursive list of all cases (flat)
-        #
-        cases = cr.get_cases(recurse=True, flat=True)
-
-        # verify the cases are all there
-        self.assertEqual(len(cases), global_iterations)
-
-        # verify the cases are in proper order
-        counter = 0
-        for i, c in enumerate(cases):
-            counter += 1
-            self.assertEqual(c.counter, counter)
-
-        #
-        # get a recursive dict of all cases (nested)
-        #
-        cases = cr.get_cases(recurse=True, flat=False)
-
-        num_cases = count_keys(cases)
-
-        self.assertEqual(num_cases, global_iterations)
-
-        #
-        # get a recursive list of child cases
-        #
-        parent_coord = 'rank0:ScipyOptimize_SLSQP|0|root._solve_nonlinear|0'
-
-        expected_coords = [
-            parent_coord + '|NLRunOnce|0|mda._solve_nonlinear|0|NonlinearBlockGS|1',
-            parent_coord + '|NLRunOnce|0|mda._solve_nonlinear|0|NonlinearBlockGS|2',
-            parent_coord + '|NLRunOnce|0|mda._solve_nonlinear|0|NonlinearBlockGS|3',
-            parent_coord + '|NLRunOnce|0|mda._solve_nonlinear|0|NonlinearBlockGS|4',
-            parent_coord + '|NLRunOnce|0|mda._solve_nonlinear|0|NonlinearBlockGS|5',
-            parent_coord + '|NLRunOnce|0|mda._solve_nonlinear|0|NonlinearBlockGS|6',
-            parent_coord + '|NLRunOnce|0|mda._solve_nonlinear|0|NonlinearBlockGS|7',
-            parent_coord + '|NLRunOnce|0|mda._solve_nonlinear|0',
-            parent_coord + '|NLRunOnce|0',
-            parent_coord
-        ]
-
-        cases = cr.get_cases(parent_coord, recurse=True, flat=True)
-
-        # verify the cases are all there and are as expected
-        self.assertEqual(len(cases), len(expected_coords))
-        for i, c in enumerate(cases):
-            self.assertEqual(c.name, expected_coords[i])
-
-        #
-        # get a list of cases for each source
-        #
-        sources = cr.list_sources(out_stream=None)
-        self.assertEqual(sorted(sources), [
-            'driver', 'root', 'root.mda', 'root.mda.nonlinear_solver', 'root.nonlinear_solver'
-        ])
-
-        # verify the coordinates of the returned cases are as expected and that the cases are all there
-        expected_coord = {
-            'driver':                    r'rank0:ScipyOptimize_SLSQP\|\d',
-            'root':                      r'rank0:ScipyOptimize_SLSQP\|\d\|root._solve_nonlinear\|\d',
-            'root.nonlinear_solver':     r'rank0:ScipyOptimize_SLSQP\|\d\|root._solve_nonlinear\|\d\|NLRunOnce\|0',
-            'root.mda':                  r'rank0:ScipyOptimize_SLSQP\|\d\|root._solve_nonlinear\|\d\|NLRunOnce\|0\|mda._solve_nonlinear\|\d',
-            'root.mda.nonlinear_solver': r'rank0:ScipyOptimize_SLSQP\|\d\|root._solve_nonlinear\|\d\|NLRunOnce\|0\|mda._solve_nonlinear\|\d\|NonlinearBlockGS\|\d',
-        }
-        counter = 0
-        mda_counter = 0
-        root_counter = 0
-        for source in sources:
-            expected = expected_coord[source]
-            cases = cr.get_cases(source, recurse=False)
-            for case in cases:
-                counter += 1
-                if source.startswith('root.mda'):  # count all cases for/under mda system
-                    mda_counter += 1
-                if source.startswith('root.'):     # count all cases for/under root solver
-                    root_counter += 1
-                self.assertRegex(case.name, expected)
-
-        self.assertEqual(counter, global_iterations)
-
-        #
-        # get a recursive list of child cases for the mda system
-        #
-        counter = 0
-        cases = cr.get_cases('root.mda', recurse=True, flat=True)
-        for case in cases:
-            counter += 1
-
-        self.assertEqual(counter, mda_counter)
-
-        #
-        # get a recursive list of child cases for the root solver
-        #
-        counter = 0
-        cases = cr.get_cases('root.nonlinear_solver', recurse=True, flat=True)
-        for case in cases:
-            counter += 1
-
-        self.assertEqual(counter, root_counter)
-
     def test_list_outputs(self):
         prob = SellarProblem(nonlinear_solver=om.NonlinearBlockGS,
                              linear_solver=om.ScipyKrylov)
@@ -2213,9 +1969,7 @@ class TestSqliteCaseReader(unittest.TestCase):
             'rank0:ScipyOptimize_SLSQP|5|root._solve_nonlinear|5|NLRunOnce|0|obj_cmp._solve_nonlinear|5',
             'rank0:ScipyOptimize_SLSQP|6|root._solve_nonlinear|6|NLRunOnce|0|obj_cmp._solve_nonlinear|6',
         ]
-        self.assertEqual(len(system_cases), len(expected_cases))
-        for i, coord in enumerate(system_cases):
-            self.assertEqual(coord, expected_cases[i])
+        self.assertListEqual(system_cases, expected_cases)
 
         # check inputs, outputs and residuals for last case
         case = cr.get_case(system_cases[-1])
@@ -2244,9 +1998,7 @@ class TestSqliteCaseReader(unittest.TestCase):
             'rank0:ScipyOptimize_SLSQP|5|root._solve_nonlinear|5|NLRunOnce|0',
             'rank0:ScipyOptimize_SLSQP|6|root._solve_nonlinear|6|NLRunOnce|0',
         ]
-        self.assertEqual(len(root_solver_cases), len(expected_cases))
-        for i, coord in enumerate(root_solver_cases):
-            self.assertEqual(coord, expected_cases[i])
+        self.assertListEqual(root_solver_cases, expected_cases)
 
         case = cr.get_case(root_solver_cases[-1])
 
@@ -2342,9 +2094,9 @@ class TestSqliteCaseReader(unittest.TestCase):
             'rank0:ScipyOptimize_SLSQP|7'
         ]
         # check that there are multiple iterations and they have the expected coordinates
-        self.assertTrue(len(driver_cases), len(expected_cases))
-        for i, coord in enumerate(driver_cases):
-            self.assertEqual(coord, expected_cases[i])
+        # (the exact number of driver iterations varies with the optimizer version)
+        self.assertTrue(len(driver_cases) > 1)
+        self.assertListEqual(driver_cases, expected_cases[:len(driver_cases)])
 
         # check VOI values from last driver iteration
         case = cr.get_case(driver_cases[-1])
@@ -3184,6 +2936,254 @@ class DummyClass(object):
         self.assertEqual(set(objs.keys()), {'z'})
 
 
+# expected child-case coordinates of the first driver iteration in the recording shared
+# by the TestSqliteCaseReaderRecurse tests; built just once, like the recording itself
+_RECURSE_PARENT_COORD = 'rank0:ScipyOptimize_SLSQP|0|root._solve_nonlinear|0'
+
+_RECURSE_CHILD_COORDS = tuple(
+    [f'{_RECURSE_PARENT_COORD}|NLRunOnce|0|mda._solve_nonlinear|0|NonlinearBlockGS|{i}'
+     for i in range(1, 8)] +
+    [f'{_RECURSE_PARENT_COORD}|NLRunOnce|0|mda._solve_nonlinear|0',
+     f'{_RECURSE_PARENT_COORD}|NLRunOnce|0',
+     _RECURSE_PARENT_COORD])
+
+
+class TestSqliteCaseReaderRecurse(unittest.TestCase):
+    """
+    Test recursive case listing and retrieval against a recording shared by all tests.
+
+    These tests only read recorded data, so the recording is written once in setUpClass
+    rather than re-running the driver for every test.
+    """
+
+    filename = 'sqlite_test_recurse'
+
+    @classmethod
+    def setUpClass(cls):
+        cls.startdir = os.getcwd()
+        cls.tempdir = mkdtemp(prefix='testdir-')
+        os.chdir(cls.tempdir)
+
+        recorder = om.SqliteRecorder(cls.filename, record_viewer_data=False)
+
+        prob = SellarProblem(SellarDerivativesGrouped, nonlinear_solver=om.NonlinearRunOnce,
+                                                       linear_solver=om.ScipyKrylov,
+                                                       mda_nonlinear_solver=om.NonlinearBlockGS)
+        prob.driver = om.ScipyOptimizeDriver(optimizer='SLSQP', tol=1e-9, disp=False)
+        prob.driver.add_recorder(recorder)
+        prob.setup()
+
+        model = prob.model
+        model.add_recorder(recorder)
+        model.mda.add_recorder(recorder)
+        model.nonlinear_solver.add_recorder(recorder)
+        model.mda.nonlinear_solver.add_recorder(recorder)
+
+        prob.run_driver()
+        prob.cleanup()
+
+    @classmethod
+    def tearDownClass(cls):
+        os.chdir(cls.startdir)
+        try:
+            rmtree(cls.tempdir)
+        except OSError:
+            pass
+
+    def test_list_cases_recurse(self):
+        cr = om.CaseReader(self.filename)
+
+        # get total iteration count to check against
+        global_iterations = len(cr._global_iterations)
+
+        #
+        # get a recursive list of all cases (flat)
+        #
+        cases = cr.list_cases(recurse=True, flat=True, out_stream=None)
+
+        # verify the cases are all there
+        self.assertEqual(len(cases), global_iterations)
+
+        # verify the cases are in proper order
+        counter = 0
+        for i, c in enumerate(cr.get_case(case) for case in cases):
+            counter += 1
+            self.assertEqual(c.counter, counter)
+
+        #
+        # get a recursive dict of all cases (nested)
+        #
+        cases = cr.list_cases(recurse=True, flat=False, out_stream=None)
+
+        num_cases = count_keys(cases)
+
+        self.assertEqual(num_cases, global_iterations)
+
+        #
+        # get a recursive list of child cases
+        #
+        parent_coord = _RECURSE_PARENT_COORD
+        expected_coords = _RECURSE_CHILD_COORDS
+
+        cases = cr.list_cases(parent_coord, recurse=True, flat=True, out_stream=None)
+
+        # verify the cases are all there and are as expected
+        self.assertEqual(len(cases), len(expected_coords))
+        for i, c in enumerate(cases):
+            self.assertEqual(c, expected_coords[i])
+
+        #
+        # get a list of cases for each source
+        #
+        sources = cr.list_sources(out_stream=None)
+        self.assertEqual(sorted(sources), [
+            'driver', 'root', 'root.mda', 'root.mda.nonlinear_solver', 'root.nonlinear_solver'
+        ])
+
+        # verify the coordinates of the returned cases are all there as expected
+        expected_coord = {
+            'driver':                    r'rank0:ScipyOptimize_SLSQP\|\d',
+            'root':                      r'rank0:ScipyOptimize_SLSQP\|\d\|root._solve_nonlinear\|\d',
+            'root.nonlinear_solver':     r'rank0:ScipyOptimize_SLSQP\|\d\|root._solve_nonlinear\|\d\|NLRunOnce\|0',
+            'root.mda':                  r'rank0:ScipyOptimize_SLSQP\|\d\|root._solve_nonlinear\|\d\|NLRunOnce\|0\|mda._solve_nonlinear\|\d',
+            'root.mda.nonlinear_solver': r'rank0:ScipyOptimize_SLSQP\|\d\|root._solve_nonlinear\|\d\|NLRunOnce\|0\|mda._solve_nonlinear\|\d\|NonlinearBlockGS\|\d',
+        }
+        counter = 0
+        mda_counter = 0
+        root_counter = 0
+        for source in sources:
+            expected = expected_coord[source]
+            cases = cr.list_cases(source, recurse=False, out_stream=None)
+            for case in cases:
+                counter += 1
+                if source.startswith('root.mda'):  # count all cases for/under mda system
+                    mda_counter += 1
+                if source.startswith('root.'):     # count all cases for/under root solver
+                    root_counter += 1
+                self.assertRegex(case, expected)
+
+        self.assertEqual(counter, global_iterations)
+
+        #
+        # get a recursive list of child cases for the mda system
+        #
+        counter = 0
+
+        cases = cr.list_cases('root.mda', recurse=True, flat=True, out_stream=None)
+        for case in cases:
+            self.assertTrue(case.index('|mda._solve_nonlinear|') > 0)
+            counter += 1
+
+        self.assertEqual(counter, mda_counter)
+
+        #
+        # get a recursive list of child cases for the root solver
+        #
+        counter = 0
+
+        cases = cr.list_cases('root.nonlinear_solver', recurse=True, flat=True, out_stream=None)
+        for case in cases:
+            self.assertTrue(case.index('|NLRunOnce|') > 0)
+            counter += 1
+
+        self.assertEqual(counter, root_counter)
+
+
+    def test_get_cases_recurse(self):
+        cr = om.CaseReader(self.filename)
+
+        # get total iteration count to check against
+        global_iterations = len(cr._global_iterations)
+
+        #
+        # get a recursive list of all cases (flat)
+        #
+        cases = cr.get_cases(recurse=True, flat=True)
+
+        # verify the cases are all there
+        self.assertEqual(len(cases), global_iterations)
+
+        # verify the cases are in proper order
+        counter = 0
+        for i, c in enumerate(cases):
+            counter += 1
+            self.assertEqual(c.counter, counter)
+
+        #
+        # get a recursive dict of all cases (nested)
+        #
+        cases = cr.get_cases(recurse=True, flat=False)
+
+        num_cases = count_keys(cases)
+
+        self.assertEqual(num_cases, global_iterations)
+
+        #
+        # get a recursive list of child cases
+        #
+        parent_coord = _RECURSE_PARENT_COORD
+        expected_coords = _RECURSE_CHILD_COORDS
+
+        cases = cr.get_cases(parent_coord, recurse=True, flat=True)
+
+        # verify the cases are all there and are as expected
+        self.assertEqual(len(cases), len(expected_coords))
+        for i, c in enumerate(cases):
+            self.assertEqual(c.name, expected_coords[i])
+
+        #
+        # get a list of cases for each source
+        #
+        sources = cr.list_sources(out_stream=None)
+        self.assertEqual(sorted(sources), [
+            'driver', 'root', 'root.mda', 'root.mda.nonlinear_solver', 'root.nonlinear_solver'
+        ])
+
+        # verify the coordinates of the returned cases are as expected and that the cases are all there
+        expected_coord = {
+            'driver':                    r'rank0:ScipyOptimize_SLSQP\|\d',
+            'root':                      r'rank0:ScipyOptimize_SLSQP\|\d\|root._solve_nonlinear\|\d',
+            'root.nonlinear_solver':     r'rank0:ScipyOptimize_SLSQP\|\d\|root._solve_nonlinear\|\d\|NLRunOnce\|0',
+            'root.mda':                  r'rank0:ScipyOptimize_SLSQP\|\d\|root._solve_nonlinear\|\d\|NLRunOnce\|0\|mda._solve_nonlinear\|\d',
+            'root.mda.nonlinear_solver': r'rank0:ScipyOptimize_SLSQP\|\d\|root._solve_nonlinear\|\d\|NLRunOnce\|0\|mda._solve_nonlinear\|\d\|NonlinearBlockGS\|\d',
+        }
+        counter = 0
+        mda_counter = 0
+        root_counter = 0
+        for source in sources:
+            expected = expected_coord[source]
+            cases = cr.get_cases(source, recurse=False)
+            for case in cases:
+                counter += 1
+                if source.startswith('root.mda'):  # count all cases for/under mda system
+                    mda_counter += 1
+                if source.startswith('root.'):     # count all cases for/under root solver
+                    root_counter += 1
+                self.assertRegex(case.name, expected)
+
+        self.assertEqual(counter, global_iterations)
+
+        #
+        # get a recursive list of child cases for the mda system
+        #
+        counter = 0
+        cases = cr.get_cases('root.mda', recurse=True, flat=True)
+        for case in cases:
+            counter += 1
+
+        self.assertEqual(counter, mda_counter)
+
+        #
+        # get a recursive list of child cases for the root solver
+        #
+        counter = 0
+        cases = cr.get_cases('root.nonlinear_solver', recurse=True, flat=True)
+        for case in cases:
+            counter += 1
+
+        self.assertEqual(counter, root_counter)
+
+
 @use_tempdirs
 class TestFeatureSqliteReader(unittest.TestCase):
 
@@ -4224,9 +4224,7 @@ class TestSqliteCaseReaderLegacy(unittest.TestCase):
             'rank0:SLSQP|4|root._solve_nonlinear|5|NLRunOnce|0|pz._solve_nonlinear|5',
             'rank0:SLSQP|5|root._solve_nonlinear|6|NLRunOnce|0|pz._solve_nonlinear|6',
         ]
-        self.assertEqual(len(system_cases), len(expected_cases))
-        for i, coord in enumerate(system_cases):
-            self.assertEqual(coord, expected_cases[i])
+        self.assertListEqual(system_cases, expected_cases)
 
         #
         # check solver cases
@@ -4242,9 +4240,7 @@ class TestSqliteCaseReaderLegacy(unittest.TestCase):
             'rank0:SLSQP|4|root._solve_nonlinear|5|NLRunOnce|0',
             'rank0:SLSQP|5|root._solve_nonlinear|6|NLRunOnce|0'
         ]
-        self.assertEqual(len(root_solver_cases), len(expected_cases))
-        for i, coord in enumerate(root_solver_cases):
-            self.assertEqual(coord, expected_cases[i])
+        self.assertListEqual(root_solver_cases, expected_cases)
 
         case = cr.get_case(root_solver_cases[-1])
 
@@ -4340,9 +4336,9 @@ class TestSqliteCaseReaderLegacy(unittest.TestCase):
             'rank0:SLSQP|5',
         ]
         # check that there are multiple iterations and they have the expected coordinates
-        self.assertTrue(len(driver_cases), len(expected_cases))
-        for i, coord in enumerate(driver_cases):
-            self.assertEqual(coord, expected_cases[i])
+        # (the exact number of driver iterations varies with the optimizer version)
+        self.assertTrue(len(driver_cases) > 1)
+        self.assertListEqual(driver_cases, expected_cases[:len(driver_cases)])
 
     def test_driver_v3(self):
         """
@@ -813,6 +813,33 @@ class TestSqliteRecorder(unittest.TestCase):
         value = cr._system_options['root']['component_options']['assembled_jac_type']
         self.assertEqual(value, 'csc')  # quick check only. Too much to check exhaustively
 
+    def test_record_no_metadata(self):
+        # option to skip recording the options/scaling metadata for systems and solvers
+        prob = om.Problem(SellarDerivatives(nonlinear_solver=om.NonlinearBlockGS,
+                                            linear_solver=om.ScipyKrylov))
+        prob.setup()
+
+        recorder = om.SqliteRecorder("cases.sql", record_viewer_data=False,
+                                     record_metadata=False)
+        prob.model.add_recorder(recorder)
+        prob.model.nonlinear_solver.add_recorder(recorder)
+
+        prob.set_solver_print(level=0)
+        prob.run_model()
+        prob.cleanup()
+
+        cr = om.CaseReader("cases.sql")
+
+        # no system or solver metadata should have been recorded
+        self.assertEqual(cr._system_options, {})
+        self.assertEqual(cr.solver_metadata, {})
+
+        # but cases should still be recorded and readable
+        self.assertEqual(sorted(cr.list_sources(out_stream=None)),
+                         ['root', 'root.nonlinear_solver'])
+        case = cr.get_case(-1)
+        assert_near_equal(case.outputs['obj'], prob['obj'], 1e-10)
+
     def test_record_system_options(self):
         # Regardless what object the case recorder is attached to, system options
         #  should be recorded for all systems in the model